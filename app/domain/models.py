@@ -74,6 +74,9 @@ class TimeEntry(BaseModel):
     notes: Optional[str] = None
     created_at: datetime = Field(default_factory=datetime.now)
 
+    # Name of the task, filled in by range queries for display; not persisted
+    task_name: Optional[str] = None
+
 
 class UserPreferences(BaseModel):
     """
@@ -18,6 +18,9 @@ SUPPORTED_LANGUAGES = ["en", "de"]
 # Current language (default to English)
 _current_language = "en"
 
+# Translation table for the current language, resolved once per switch
+_current_translations = TRANSLATIONS.get(_current_language, {})
+
 # Callbacks to notify when language changes
 _language_changed_callbacks: List[Callable[[str], None]] = []
 
@@ -53,10 +56,11 @@ def set_language(lang: str) -> None:
     Args:
         lang: Language code ('en' or 'de')
     """
-    global _current_language
+    global _current_language, _current_translations
     if lang not in SUPPORTED_LANGUAGES:
         lang = 'en'
     _current_language = lang
+    _current_translations = TRANSLATIONS.get(lang, TRANSLATIONS.get('en', {}))
 
     # Update Qt Locale for dates and standard widgets
     if lang == 'de':
@@ -83,8 +87,7 @@ def tr(key: str, **kwargs) -> str:
     Returns:
         Translated string, or the key itself if not found.
     """
-    translations = TRANSLATIONS.get(_current_language, TRANSLATIONS.get('en', {}))
-    text = translations.get(key, key)
+    text = _current_translations.get(key, key)
 
     # Apply format arguments if provided
     if kwargs:
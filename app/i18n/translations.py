@@ -259,6 +259,7 @@ TRANSLATIONS = {
         "task_mgmt.archive_error": "Failed to archive task: {error}",
         "task_mgmt.duplicate_error": "A task with this name already exists.",
         "task_mgmt.show_archived": "Show Archived",
+        "task_mgmt.loading": "Loading…",
 
         # Accounting Management
         "acc_mgmt.title": "Manage Accounting",
@@ -584,6 +585,7 @@ TRANSLATIONS = {
         "task_mgmt.archive_error": "Aufgabe konnte nicht archiviert werden: {error}",
         "task_mgmt.duplicate_error": "Eine Aufgabe mit diesem Namen existiert bereits.",
         "task_mgmt.show_archived": "Archivierte anzeigen",
+        "task_mgmt.loading": "Wird geladen…",
 
         # Accounting Management
         "acc_mgmt.title": "Kontierung verwalten",
@@ -57,7 +57,7 @@ class TimeEntryModel(Base):
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     task_id: Mapped[int] = mapped_column(Integer, ForeignKey("tasks.id"), nullable=False)
-    start_time: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    start_time: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
     end_time: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     duration_seconds: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     was_interrupted: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
@@ -128,3 +128,10 @@ async def init_db(db_url: Optional[str] = None):
             await conn.commit()
         except Exception:
             pass
+
+    # Index for day/month range queries on existing databases (v3)
+    async with engine.engine.connect() as conn:
+        await conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_time_entries_start_time ON time_entries (start_time)"
+        ))
+        await conn.commit()
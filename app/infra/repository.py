@@ -10,8 +10,9 @@ Separates data access logic from business logic. Makes it easy to:
 """
 
 from datetime import datetime
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, NamedTuple, Iterable, Sequence
 import json
+import weakref
 from pathlib import Path
 
 from sqlalchemy import select, update, and_, func
@@ -62,14 +63,40 @@ class UserRepository:
 
 
 
+class AccountingRow(NamedTuple):
+    """
+    Read-only projection of an accounting profile for list views.
+
+    Built straight from selected columns, so no ORM instance state or
+    model validation is paid per row.
+    """
+    id: int
+    name: str
+    attributes: Dict[str, str]
+
+
 class AccountingRepository:
     """
     Handles Accounting-related database operations.
+
+    Active profiles are cached per database (the shared engine, or an
+    injected session) for all repository instances, so a write through any
+    instance invalidates the cached list for every other one.
     """
 
+    _active_cache: "weakref.WeakKeyDictionary[object, List[Accounting]]" = weakref.WeakKeyDictionary()
+
     def __init__(self, session: Optional[AsyncSession] = None):
         self.session = session
 
+    def _cache_owner(self) -> object:
+        """The database the cached profiles belong to"""
+        return self.session if self.session is not None else get_engine()
+
+    def invalidate_cache(self) -> None:
+        """Drop cached profiles (e.g. after a write or a restored database)"""
+        self._active_cache.pop(self._cache_owner(), None)
+
     async def _get_session(self) -> AsyncSession:
         if self.session:
             return self.session
@@ -78,13 +105,28 @@ class AccountingRepository:
 
     async def get_all_active(self) -> List[Accounting]:
         """Get all active accounting profiles"""
+        cached = self._active_cache.get(self._cache_owner())
+        if cached is None:
+            session = await self._get_session()
+            async with session:
+                result = await session.execute(
+                    select(AccountingModel).where(AccountingModel.is_active == True)
+                )
+                models = result.scalars().all()
+                cached = [Accounting.model_validate(m) for m in models]
+            self._active_cache[self._cache_owner()] = cached
+        # Copies, so callers cannot change the cached profiles
+        return [accounting.model_copy(deep=True) for accounting in cached]
+
+    async def get_all_active_projection(self) -> List[AccountingRow]:
+        """Get id, name and attributes of all active accounting profiles"""
         session = await self._get_session()
         async with session:
             result = await session.execute(
-                select(AccountingModel).where(AccountingModel.is_active == True)
+                select(AccountingModel.id, AccountingModel.name, AccountingModel.attributes)
+                .where(AccountingModel.is_active == True)
             )
-            models = result.scalars().all()
-            return [Accounting.model_validate(m) for m in models]
+            return [AccountingRow(*row) for row in result.all()]
 
     async def create(self, accounting: Accounting) -> Accounting:
         """Create a new accounting profile"""
@@ -98,6 +140,7 @@ class AccountingRepository:
             )
             session.add(model)
             await session.commit()
+            self.invalidate_cache()
             await session.refresh(model)
             return Accounting.model_validate(model)
 
@@ -111,6 +154,7 @@ class AccountingRepository:
                 .values(is_active=False)
             )
             await session.commit()
+            self.invalidate_cache()
 
     async def update(self, accounting: Accounting) -> Accounting:
         """Update an existing accounting profile"""
@@ -127,6 +171,7 @@ class AccountingRepository:
             model.is_active = accounting.is_active
 
             await session.commit()
+            self.invalidate_cache()
             return accounting
 
     async def delete_all(self) -> int:
@@ -136,6 +181,7 @@ class AccountingRepository:
         async with session:
             result = await session.execute(delete(AccountingModel))
             await session.commit()
+            self.invalidate_cache()
             return result.rowcount
 
 
@@ -265,6 +311,9 @@ class TimeEntryRepository:
     Handles all TimeEntry-related database operations.
     """
 
+    # IDs per IN (...) clause, well below SQLite's bound parameter limit
+    ID_CHUNK_SIZE = 500
+
     def __init__(self, session: Optional[AsyncSession] = None):
         self.session = session
 
@@ -275,25 +324,41 @@ class TimeEntryRepository:
         engine = get_engine()
         return engine.get_session()
 
+    @staticmethod
+    def _to_model(entry: TimeEntry) -> TimeEntryModel:
+        return TimeEntryModel(
+            task_id=entry.task_id,
+            start_time=entry.start_time,
+            end_time=entry.end_time,
+            duration_seconds=entry.duration_seconds,
+            was_interrupted=entry.was_interrupted,
+            interruption_handled=entry.interruption_handled,
+            notes=entry.notes,
+            created_at=entry.created_at
+        )
+
     async def create(self, entry: TimeEntry) -> TimeEntry:
         """Create a new time entry"""
         session = await self._get_session()
         async with session:
-            entry_model = TimeEntryModel(
-                task_id=entry.task_id,
-                start_time=entry.start_time,
-                end_time=entry.end_time,
-                duration_seconds=entry.duration_seconds,
-                was_interrupted=entry.was_interrupted,
-                interruption_handled=entry.interruption_handled,
-                notes=entry.notes,
-                created_at=entry.created_at
-            )
+            entry_model = self._to_model(entry)
             session.add(entry_model)
             await session.commit()
             await session.refresh(entry_model)
             return TimeEntry.model_validate(entry_model)
 
+    async def create_many(self, entries: Iterable[TimeEntry]) -> List[TimeEntry]:
+        """Create several time entries in one transaction"""
+        session = await self._get_session()
+        async with session:
+            entry_models = [self._to_model(entry) for entry in entries]
+            if not entry_models:
+                return []
+            session.add_all(entry_models)
+            # IDs are assigned on flush and kept after commit, so no refresh
+            await session.commit()
+            return [TimeEntry.model_validate(em) for em in entry_models]
+
     async def update(self, entry: TimeEntry) -> TimeEntry:
         """Update an existing time entry"""
         session = await self._get_session()
@@ -395,6 +460,24 @@ class TimeEntryRepository:
             )
             await session.commit()
 
+    async def delete_many(self, entry_ids: Sequence[int]) -> int:
+        """Delete time entries by ID in one transaction. Returns count of deleted rows."""
+        from sqlalchemy import delete
+        entry_ids = list(entry_ids)
+        if not entry_ids:
+            return 0
+        session = await self._get_session()
+        async with session:
+            deleted = 0
+            for i in range(0, len(entry_ids), self.ID_CHUNK_SIZE):
+                chunk = entry_ids[i:i + self.ID_CHUNK_SIZE]
+                result = await session.execute(
+                    delete(TimeEntryModel).where(TimeEntryModel.id.in_(chunk))
+                )
+                deleted += result.rowcount
+            await session.commit()
+            return deleted
+
     async def delete_all(self) -> int:
         """Delete all time entries. Returns count of deleted rows."""
         from sqlalchemy import delete
@@ -465,3 +548,57 @@ class TimeEntryRepository:
             result = await session.execute(query)
             entry_models = result.scalars().all()
             return [TimeEntry.model_validate(em) for em in entry_models]
+
+    async def get_overlapping_range(self, start_time: datetime, end_time: datetime,
+                                    task_ids: Optional[Iterable[int]] = None) -> List[TimeEntry]:
+        """
+        Get all time entries overlapping the given time range in one query.
+
+        Uses the same overlap rules as get_overlapping(). Each entry's
+        task_name is filled in from the joined task.
+
+        Args:
+            start_time: Start of the range
+            end_time: End of the range
+            task_ids: Optional task IDs to restrict the result to
+
+        Returns:
+            Entries ordered by start time
+        """
+        session = await self._get_session()
+        async with session:
+            query = (
+                select(TimeEntryModel, TaskModel.name)
+                .join(TaskModel, TaskModel.id == TimeEntryModel.task_id)
+                .where(
+                    and_(
+                        TimeEntryModel.start_time < end_time,
+                        (
+                            (TimeEntryModel.end_time == None) & (TimeEntryModel.start_time >= start_time) |
+                            (TimeEntryModel.end_time != None) & (TimeEntryModel.end_time > start_time)
+                        )
+                    )
+                )
+            )
+            if task_ids is None:
+                chunks = [None]
+            else:
+                # Many task IDs are split over several IN clauses
+                task_ids = list(task_ids)
+                chunks = [task_ids[i:i + self.ID_CHUNK_SIZE]
+                          for i in range(0, len(task_ids), self.ID_CHUNK_SIZE)]
+
+            rows = []
+            for chunk in chunks:
+                chunk_query = query if chunk is None else query.where(TimeEntryModel.task_id.in_(chunk))
+                result = await session.execute(chunk_query.order_by(TimeEntryModel.start_time))
+                rows.extend(result.all())
+            if len(chunks) > 1:
+                rows.sort(key=lambda row: row[0].start_time)
+
+            entries = []
+            for em, task_name in rows:
+                entry = TimeEntry.model_validate(em)
+                entry.task_name = task_name
+                entries.append(entry)
+            return entries
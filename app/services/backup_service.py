@@ -119,22 +119,21 @@ class BackupService:
                 "accounting_id": task.accounting_id
             })
 
-        # Export time entries (all entries)
-        for task in tasks:
-            entries = await self.entry_repo.get_overlapping(
-                task.id,
-                datetime(2000, 1, 1),  # Far past
-                datetime(2100, 12, 31)  # Far future
-            )
-            for entry in entries:
-                backup_data["data"]["time_entries"].append({
-                    "id": entry.id,
-                    "task_id": entry.task_id,
-                    "start_time": entry.start_time.isoformat(),
-                    "end_time": entry.end_time.isoformat() if entry.end_time else None,
-                    "duration_seconds": entry.duration_seconds,
-                    "notes": entry.notes
-                })
+        # Export time entries (all entries of the exported tasks, in one query)
+        entries = await self.entry_repo.get_overlapping_range(
+            datetime(2000, 1, 1),  # Far past
+            datetime(2100, 12, 31),  # Far future
+            task_ids=[task.id for task in tasks]
+        )
+        for entry in entries:
+            backup_data["data"]["time_entries"].append({
+                "id": entry.id,
+                "task_id": entry.task_id,
+                "start_time": entry.start_time.isoformat(),
+                "end_time": entry.end_time.isoformat() if entry.end_time else None,
+                "duration_seconds": entry.duration_seconds,
+                "notes": entry.notes
+            })
 
         # Export preferences
         prefs = await self.user_repo.get_preferences()
@@ -6,9 +6,18 @@ This allows easy extension to support other countries' calendars in the future.
 """
 
 import datetime
+from functools import lru_cache
+from typing import Dict
+
 import holidays
 
 
+@lru_cache(maxsize=8)
+def _holidays_for_year(german_state: str, year: int, language: str) -> Dict[datetime.date, str]:
+    """Holiday names of one year and state, keyed by date"""
+    return dict(holidays.country_holidays('DE', subdiv=german_state, years=year, language=language))
+
+
 class CalendarService:
     """
     Handles German holiday logic.
@@ -33,6 +42,7 @@ class CalendarService:
         # Detect language from app setting
         from app.i18n import get_language
         lang = get_language()
+        self.language = lang
 
         # 'holidays' library uses 'de' for German, 'en' for English
         # For Germany (DE), it usually supports 'de' (default) and 'en'.
@@ -71,6 +81,23 @@ class CalendarService:
         """
         return self.de_holidays.get(date_obj, "")
 
+    def get_holidays_in_month(self, year: int, month: int) -> Dict[datetime.date, str]:
+        """
+        Get the holidays of a month.
+
+        The holidays of a whole year are computed once per state and
+        language and reused for each of its months.
+
+        Args:
+            year: Year of the month
+            month: Month number (1-12)
+
+        Returns:
+            Holiday names keyed by date
+        """
+        year_holidays = _holidays_for_year(self.german_state, year, self.language)
+        return {day: name for day, name in year_holidays.items() if day.month == month}
+
     def is_weekend(self, date_obj: datetime.date) -> bool:
         """Check if date is a weekend"""
         return date_obj.weekday() > 4
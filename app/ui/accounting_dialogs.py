@@ -1,34 +1,43 @@
 import asyncio
-from typing import List
+from typing import List, Optional
 
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton,
     QInputDialog, QMessageBox, QTableWidget, QTableWidgetItem,
-    QHeaderView, QMenu
+    QHeaderView, QMenu, QAbstractItemView
 )
 from PySide6.QtGui import QAction
 from PySide6.QtCore import Qt
 
-from app.domain.models import Accounting
-from app.infra.repository import AccountingRepository, UserRepository
+from app.domain.models import Accounting, UserPreferences
+from app.infra.repository import AccountingRepository, AccountingRow, UserRepository
 from app.i18n import tr
+from app.utils import get_event_loop
 
 class AccountingManagementDialog(QDialog):
     """
     Manage Accounting Profiles (List, Add, Edit, Delete).
     Supports inline editing and property management.
     """
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, loop: Optional[asyncio.AbstractEventLoop] = None,
+                 repo: Optional[AccountingRepository] = None,
+                 user_repo: Optional[UserRepository] = None):
         super().__init__(parent)
         self.setWindowTitle(tr("acc_mgmt.title"))
         self.resize(800, 500)
+
+        self.loop = loop or get_event_loop()
+        # Repositories are normally shared by the owning window
+        self.repo = repo or AccountingRepository()
+        self.user_repo = user_repo or UserRepository()
         
-        self.loop = asyncio.get_event_loop()
-        self.repo = AccountingRepository()
-        self.user_repo = UserRepository()
-        
-        self.profiles: List[Accounting] = []
+        self._prefs: Optional[UserPreferences] = None
+        self.profiles: List[AccountingRow] = []
+        # Display values per profile (name followed by attribute columns)
+        self._rows: List[List[str]] = []
         self.columns: List[str] = []
+        # Column index -> attribute key; index 0 is the profile name
+        self._col_to_attr: List[Optional[str]] = [None]
         
         self._setup_ui()
         self._load_data()
@@ -39,6 +48,10 @@ class AccountingManagementDialog(QDialog):
         self.table = QTableWidget()
         self.table.setSelectionBehavior(QTableWidget.SelectRows)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        # Uniform row height so Qt never measures rows individually
+        vertical_header = self.table.verticalHeader()
+        vertical_header.setDefaultSectionSize(vertical_header.defaultSectionSize())
+        vertical_header.setSectionResizeMode(QHeaderView.Fixed)
         # Enable item changed signal for inline editing
         self.table.itemChanged.connect(self._on_item_changed)
         
@@ -75,40 +88,77 @@ class AccountingManagementDialog(QDialog):
         
     def _load_data(self):
         try:
-            # Load Columns
-            prefs = self.loop.run_until_complete(self.user_repo.get_preferences())
-            self.columns = list(prefs.accounting_columns)
-            
-            # Load Profiles
-            self.profiles = self.loop.run_until_complete(self.repo.get_all_active())
+            # Columns and profiles are independent, so fetch them concurrently
+            self._prefs, self.profiles = self.loop.run_until_complete(asyncio.gather(
+                self.user_repo.get_preferences(),
+                self.repo.get_all_active_projection()
+            ))
+            self._set_columns(self._prefs.accounting_columns)
+            self._rebuild_rows()
             self._refresh_table()
         except Exception as e:
             QMessageBox.critical(self, tr("error"), tr("acc_mgmt.load_error").format(error=e))
             
+    def _set_columns(self, columns: List[str]):
+        """Set the property columns and rebuild the column-to-attribute mapping"""
+        self.columns = list(columns)
+        self._col_to_attr = [None] + self.columns
+
+    def _save_columns(self, columns: List[str]):
+        """Persist property columns using the cached preferences and redraw the table.
+
+        Profiles are unaffected by column changes, so they are not reloaded.
+        """
+        if self._prefs is None:
+            self._prefs = self.loop.run_until_complete(self.user_repo.get_preferences())
+        self._prefs.accounting_columns = list(columns)
+        self.loop.run_until_complete(self.user_repo.update_preferences(self._prefs))
+        self._set_columns(columns)
+        self._rebuild_rows()
+        self._refresh_table()
+
+    def _build_row(self, profile: AccountingRow) -> List[str]:
+        """Resolve the display values of a profile once, in column order"""
+        attributes = profile.attributes
+        return [profile.name] + [attributes.get(attr, "") for attr in self._col_to_attr[1:]]
+
+    def _rebuild_rows(self):
+        """Rebuild the display rows after profiles or columns changed"""
+        self._rows = [self._build_row(profile) for profile in self.profiles]
+
     def _refresh_table(self):
+        header = self.table.horizontalHeader()
+        sorting_enabled = self.table.isSortingEnabled()
+        edit_triggers = self.table.editTriggers()
+
         self.table.blockSignals(True) # Prevent saving while loading
-        self.table.clear()
-        
-        headers = [tr("acc_mgmt.header_name")] + self.columns
-        self.table.setColumnCount(len(headers))
-        self.table.setHorizontalHeaderLabels(headers)
-        self.table.setRowCount(len(self.profiles))
-        
-        for row, profile in enumerate(self.profiles):
-            # Name Column (0)
-            name_item = QTableWidgetItem(profile.name)
-            name_item.setFlags(name_item.flags() | Qt.ItemIsEditable)
-            self.table.setItem(row, 0, name_item)
-            
-            # Attribute Columns
-            for col_idx, col_name in enumerate(self.columns):
-                val = profile.attributes.get(col_name, "")
-                item = QTableWidgetItem(val)
-                item.setFlags(item.flags() | Qt.ItemIsEditable)
-                self.table.setItem(row, col_idx + 1, item)
-                
-        self.table.blockSignals(False)
-    
+        self.table.setUpdatesEnabled(False)
+        self.table.setSortingEnabled(False)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        # Stretch mode reflows every column on each insertion; apply it once afterwards
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        try:
+            self.table.clear()
+
+            headers = [tr("acc_mgmt.header_name")] + self.columns
+            self.table.setColumnCount(len(headers))
+            self.table.setHorizontalHeaderLabels(headers)
+            self.table.setRowCount(len(self.profiles))
+
+            editable = Qt.ItemIsEditable
+            set_item = self.table.setItem
+            for row, values in enumerate(self._rows):
+                items = [QTableWidgetItem(val) for val in values]
+                for col, item in enumerate(items):
+                    item.setFlags(item.flags() | editable)
+                    set_item(row, col, item)
+        finally:
+            header.setSectionResizeMode(QHeaderView.Stretch)
+            self.table.setSortingEnabled(sorting_enabled)
+            self.table.setEditTriggers(edit_triggers)
+            self.table.setUpdatesEnabled(True)
+            self.table.blockSignals(False)
+
     def _on_item_changed(self, item: QTableWidgetItem):
         """Handle inline edits"""
         row = item.row()
@@ -121,21 +171,22 @@ class AccountingManagementDialog(QDialog):
         new_value = item.text().strip()
         
         # Determine what changed
-        if col == 0:
+        attr = self._col_to_attr[col]
+        if attr is None:
             # Name changed
             if not new_value:
-                return 
-            profile.name = new_value
+                return
+            profile = profile._replace(name=new_value)
+            self.profiles[row] = profile
         else:
-            # Attribute changed
-            # Columns are at col-1 in attributes list
-            if col - 1 < len(self.columns):
-                col_name = self.columns[col - 1]
-                profile.attributes[col_name] = new_value
-                
+            profile.attributes[attr] = new_value
+        self._rows[row][col] = new_value
+
         # Save to DB
         try:
-            self.loop.run_until_complete(self.repo.update(profile))
+            self.loop.run_until_complete(self.repo.update(
+                Accounting(id=profile.id, name=profile.name, attributes=profile.attributes)
+            ))
         except Exception as e:
             self.table.blockSignals(True)
             QMessageBox.critical(self, tr("error"), tr("acc_mgmt.update_error").format(error=e))
@@ -162,11 +213,11 @@ class AccountingManagementDialog(QDialog):
         # Column 0 is Name, cannot delete
         if col <= 0:
             return
-            
+
         # Check if it corresponds to a dynamic property
-        if col - 1 < len(self.columns):
-            col_name = self.columns[col - 1]
-            
+        if col < len(self._col_to_attr):
+            col_name = self._col_to_attr[col]
+
             menu = QMenu(self)
             # "Delete Property 'X'"
             del_action = QAction(f"{tr('action.delete')} '{col_name}'", self)
@@ -183,7 +234,9 @@ class AccountingManagementDialog(QDialog):
         )
         try:
             created = self.loop.run_until_complete(self.repo.create(new_profile))
-            self.profiles.append(created)
+            profile = AccountingRow(created.id, created.name, created.attributes)
+            self.profiles.append(profile)
+            self._rows.append(self._build_row(profile))
             
             # Refresh table to show new row
             self._refresh_table()
@@ -210,16 +263,7 @@ class AccountingManagementDialog(QDialog):
             
             # Update Preferences
             try:
-                prefs = self.loop.run_until_complete(self.user_repo.get_preferences())
-                current_cols = list(prefs.accounting_columns)
-                current_cols.append(text)
-                
-                prefs.accounting_columns = current_cols
-                self.loop.run_until_complete(self.user_repo.update_preferences(prefs))
-                
-                # Reload UI
-                self._load_data()
-                
+                self._save_columns(self.columns + [text])
             except Exception as e:
                 QMessageBox.critical(self, tr("error"), tr("acc_settings.save_error").format(error=e))
 
@@ -249,15 +293,7 @@ class AccountingManagementDialog(QDialog):
         )
         if reply == QMessageBox.Yes:
             try:
-                prefs = self.loop.run_until_complete(self.user_repo.get_preferences())
-                current_cols = list(prefs.accounting_columns)
-                if col_name in current_cols:
-                    current_cols.remove(col_name)
-                    
-                prefs.accounting_columns = current_cols
-                self.loop.run_until_complete(self.user_repo.update_preferences(prefs))
-                
-                self._load_data()
+                self._save_columns([c for c in self.columns if c != col_name])
             except Exception as e:
                 QMessageBox.critical(self, tr("error"), tr("acc_settings.save_error").format(error=e))
                 
@@ -2,18 +2,37 @@
 Dialogs for handling interruptions and manual entry.
 """
 
-from typing import List
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
 from datetime import datetime
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QLabel, QPushButton, QHBoxLayout, 
-    QComboBox, QDateEdit, QTimeEdit, QTextEdit, QFormLayout, 
-    QDialogButtonBox, QMessageBox
+    QComboBox, QDateEdit, QTimeEdit, QPlainTextEdit, QFormLayout, 
+    QDialogButtonBox, QMessageBox, QCompleter
 )
-from PySide6.QtCore import QDate, QTime
+from PySide6.QtCore import Qt, QDateTime, QStringListModel, QObject
+from PySide6.QtGui import QStandardItem, QStandardItemModel
 
 from app.domain.models import Task, TimeEntry
 from app.i18n import tr
 
+_OK_CANCEL = QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
+
+
+def build_combo_model(items: Iterable[Tuple[str, Any]],
+                      parent: Optional[QObject] = None) -> QStandardItemModel:
+    """
+    Build a combo box model from (label, data) pairs in one pass.
+
+    The data is stored under Qt.UserRole, so findData() and currentData()
+    work as with addItem(label, data).
+    """
+    model = QStandardItemModel(parent)
+    for label, data in items:
+        item = QStandardItem(label)
+        item.setData(data, Qt.UserRole)
+        model.appendRow(item)
+    return model
+
 
 class InterruptionDialog(QDialog):
     """
@@ -22,61 +41,92 @@ class InterruptionDialog(QDialog):
     
     def __init__(self, elapsed_minutes: float, parent=None):
         super().__init__(parent)
-        self.setWindowTitle(tr("interruption.title"))
         self.choice = "ignore"  # default
         self.setModal(True)
         
         # Setup UI
         layout = QVBoxLayout()
         
-        # Message
-        message_label = QLabel(tr("interruption.message", minutes=elapsed_minutes))
-        message_label.setStyleSheet("font-size: 14px; font-weight: bold;")
-        layout.addWidget(message_label)
+        # Message (styled by the application stylesheet)
+        self.message_label = QLabel()
+        self.message_label.setObjectName("interruptionMessage")
+        layout.addWidget(self.message_label)
 
-        question_label = QLabel(tr("interruption.question"))
-        layout.addWidget(question_label)
+        self.question_label = QLabel()
+        layout.addWidget(self.question_label)
 
         layout.addSpacing(20)
 
         # Buttons
         btn_layout = QHBoxLayout()
 
-        btn_break = QPushButton(tr("interruption.btn_break"))
-        btn_break.setMinimumHeight(60)
-        btn_break.clicked.connect(lambda: self.set_choice("ignore"))
+        self.btn_break = QPushButton()
+        self.btn_break.setMinimumHeight(60)
+        self.btn_break.clicked.connect(self._choose_ignore)
 
-        btn_work = QPushButton(tr("interruption.btn_work"))
-        btn_work.setMinimumHeight(60)
-        btn_work.clicked.connect(lambda: self.set_choice("track"))
+        self.btn_work = QPushButton()
+        self.btn_work.setMinimumHeight(60)
+        self.btn_work.clicked.connect(self._choose_track)
         
-        btn_layout.addWidget(btn_break)
-        btn_layout.addWidget(btn_work)
+        btn_layout.addWidget(self.btn_break)
+        btn_layout.addWidget(self.btn_work)
         
         layout.addLayout(btn_layout)
         
         self.setLayout(layout)
         self.setMinimumWidth(400)
-    
+
+        self.update_elapsed(elapsed_minutes)
+
+    def update_elapsed(self, elapsed_minutes: float):
+        """Reset the dialog for a new interruption of the given length"""
+        self.choice = "ignore"
+        # All texts are set here so a reused dialog follows language changes
+        self.setWindowTitle(tr("interruption.title"))
+        self.message_label.setText(tr("interruption.message", minutes=elapsed_minutes))
+        self.question_label.setText(tr("interruption.question"))
+        self.btn_break.setText(tr("interruption.btn_break"))
+        self.btn_work.setText(tr("interruption.btn_work"))
+
+    def showEvent(self, event):
+        """Bring a reused dialog to the front when it is shown again"""
+        super().showEvent(event)
+        self.raise_()
+        self.activateWindow()
+
     def set_choice(self, choice: str):
         """Set the user's choice and close dialog"""
         self.choice = choice
         self.accept()
 
+    def _choose_ignore(self):
+        self.set_choice("ignore")
+
+    def _choose_track(self):
+        self.set_choice("track")
+
 
 class ManualEntryDialog(QDialog):
     """
     Dialog for manually adding a past time entry.
+
+    Can be reused: call reset() (and set_tasks() if the tasks changed)
+    before showing it again.
     """
     
-    def __init__(self, tasks: List[Task], parent=None):
+    def __init__(self, tasks: Sequence[Task], parent=None):
         super().__init__(parent)
-        self.setWindowTitle(tr("manual_entry.title_add"))
-        self.tasks = tasks
+        self.tasks: Sequence[Task] = []
+        # Lowercased name -> task ID, used to resolve typed names
+        self._name_to_id: Dict[str, int] = {}
+        # (start, end) computed by the last successful validation
+        self._last_range: Optional[Tuple[datetime, datetime]] = None
         self.setModal(True)
         self.setMinimumWidth(400)
 
         self._setup_ui()
+        self.set_tasks(tasks)
+        self.reset()
 
     def _setup_ui(self):
         layout = QVBoxLayout(self)
@@ -85,25 +135,31 @@ class ManualEntryDialog(QDialog):
         # Task Selection
         self.task_combo = QComboBox()
         self.task_combo.setEditable(True)  # Allow creating new tasks
-        for task in self.tasks:
-            self.task_combo.addItem(task.name, task.id)
+
+        # Prefix completion over a sorted model lets Qt binary-search the names
+        self._completion_model = QStringListModel(self)
+        completer = QCompleter(self._completion_model, self)
+        completer.setCaseSensitivity(Qt.CaseInsensitive)
+        completer.setModelSorting(QCompleter.CaseInsensitivelySortedModel)
+        completer.setCompletionMode(QCompleter.PopupCompletion)
+        self.task_combo.setCompleter(completer)
         form_layout.addRow(tr("manual_entry.task"), self.task_combo)
 
-        # Date
-        self.date_edit = QDateEdit(QDate.currentDate())
+        # Date (defaults are filled in by reset())
+        self.date_edit = QDateEdit()
         self.date_edit.setCalendarPopup(True)
         form_layout.addRow(tr("manual_entry.date"), self.date_edit)
 
         # Start Time
-        self.start_time = QTimeEdit(QTime.currentTime().addSecs(-3600)) # Default 1 hr ago
+        self.start_time = QTimeEdit()
         form_layout.addRow(tr("manual_entry.start_time"), self.start_time)
 
         # End Time
-        self.end_time = QTimeEdit(QTime.currentTime())
+        self.end_time = QTimeEdit()
         form_layout.addRow(tr("manual_entry.end_time"), self.end_time)
 
         # Notes
-        self.notes_edit = QTextEdit()
+        self.notes_edit = QPlainTextEdit()
         self.notes_edit.setPlaceholderText(tr("manual_entry.notes_placeholder"))
         self.notes_edit.setMaximumHeight(80)
         form_layout.addRow(tr("manual_entry.notes"), self.notes_edit)
@@ -111,11 +167,40 @@ class ManualEntryDialog(QDialog):
         layout.addLayout(form_layout)
         
         # Buttons
-        button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        button_box = QDialogButtonBox(_OK_CANCEL)
         button_box.accepted.connect(self._validate_and_accept)
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
     
+    def set_tasks(self, tasks: Sequence[Task]):
+        """Replace the tasks offered by the task selector"""
+        self.tasks = tasks
+        self._name_to_id = {task.name.lower(): task.id for task in tasks}
+
+        # The combo box deletes the model it owned before
+        self.task_combo.blockSignals(True)
+        self.task_combo.setModel(
+            build_combo_model(((task.name, task.id) for task in tasks), self.task_combo)
+        )
+        self.task_combo.blockSignals(False)
+        self._completion_model.setStringList(sorted((task.name for task in tasks), key=str.lower))
+
+    def reset(self):
+        """Restore the defaults for a new entry"""
+        self.setWindowTitle(tr("manual_entry.title_add"))
+        self._last_range = None
+
+        self.task_combo.setCurrentIndex(0 if self.tasks else -1)
+
+        # Read the clock once so the default date and times agree, even around midnight
+        now_dt = QDateTime.currentDateTime()
+        now = now_dt.time()
+        self.date_edit.setDate(now_dt.date())
+        self.start_time.setTime(now.addSecs(-3600)) # Default 1 hr ago
+        self.end_time.setTime(now)
+
+        self.notes_edit.clear()
+
     def set_data(self, entry: TimeEntry):
         """Pre-fill dialog with existing entry data"""
         self.setWindowTitle(tr("manual_entry.title_edit"))
@@ -125,33 +210,33 @@ class ManualEntryDialog(QDialog):
         if index >= 0:
             self.task_combo.setCurrentIndex(index)
             
-        # Set Date
-        self.date_edit.setDate(entry.start_time.date())
-        
-        # Set Time
-        self.start_time.setTime(entry.start_time.time())
+        # Set Date and Time
+        start = QDateTime(entry.start_time)
+        self.date_edit.setDate(start.date())
+        self.start_time.setTime(start.time())
         if entry.end_time:
-            self.end_time.setTime(entry.end_time.time())
+            self.end_time.setTime(QDateTime(entry.end_time).time())
             
         # Set Notes
         if entry.notes:
-            self.notes_edit.setText(entry.notes)
+            self.notes_edit.setPlainText(entry.notes)
+
+    def _compute_range(self) -> Tuple[datetime, datetime]:
+        """Return the entered start and end as datetimes"""
+        date = self.date_edit.date()
+        start = QDateTime(date, self.start_time.time())
+        end = QDateTime(date, self.end_time.time())
+        return start.toPython(), end.toPython()
 
     def _validate_and_accept(self):
         """Validate input before accepting"""
-        start_time = self.start_time.time().toPython()
-        end_time = self.end_time.time().toPython()
-        date = self.date_edit.date().toPython()
-        
-        start_dt = datetime.combine(date, start_time)
-        end_dt = datetime.combine(date, end_time)
-        now = datetime.now()
-        
+        start_dt, end_dt = self._compute_range()
+
         if start_dt >= end_dt:
             QMessageBox.warning(self, tr("manual_entry.invalid_time_title"), tr("manual_entry.invalid_time_msg_order"))
             return
 
-        if end_dt > now:
+        if end_dt > datetime.now():
             QMessageBox.warning(self, tr("manual_entry.invalid_time_title"), tr("manual_entry.invalid_time_msg_future"))
             return
 
@@ -161,8 +246,7 @@ class ManualEntryDialog(QDialog):
             QMessageBox.warning(self, tr("manual_entry.invalid_task_title"), tr("manual_entry.invalid_task_msg"))
             return
 
-        existing = next((t for t in self.tasks if t.name.lower() == task_name.lower()), None)
-        if not existing:
+        if task_name.lower() not in self._name_to_id:
             # Task does not exist, ask user
             ret = QMessageBox.question(
                 self,
@@ -173,7 +257,8 @@ class ManualEntryDialog(QDialog):
             )
             if ret != QMessageBox.Yes:
                 return
-            
+
+        self._last_range = (start_dt, end_dt)
         self.accept()
     
     def get_data(self):
@@ -182,19 +267,10 @@ class ManualEntryDialog(QDialog):
         
         # Resolve task_id from name manually to handle edits correctly
         # currentData() might return old ID if user typed a name that exists but didn't select it from dropdown
-        task_id = None
-        for task in self.tasks:
-            if task.name.lower() == task_name.lower():
-                task_id = task.id
-                break
-        
-        date = self.date_edit.date().toPython()
-        start_time = self.start_time.time().toPython()
-        end_time = self.end_time.time().toPython()
-        
-        start_dt = datetime.combine(date, start_time)
-        end_dt = datetime.combine(date, end_time)
-        
+        task_id = self._name_to_id.get(task_name.lower())
+
+        start_dt, end_dt = self._last_range or self._compute_range()
+
         return {
             "task_name": task_name,
             "task_id": task_id,
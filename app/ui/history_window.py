@@ -1,18 +1,28 @@
 import asyncio
 import calendar
-from datetime import datetime, timedelta
-from typing import List, Dict
+import logging
+from functools import lru_cache
+from collections import OrderedDict, defaultdict, deque
+from operator import itemgetter
+from datetime import datetime, time, timedelta
+from typing import List, Dict, NamedTuple, Optional, Tuple
 
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QCalendarWidget, QTableWidget,
-    QTableWidgetItem, QPushButton, QLabel, QHeaderView, QMessageBox, QMenu,
+    QWidget, QVBoxLayout, QHBoxLayout, QCalendarWidget, QTableView,
+    QPushButton, QLabel, QHeaderView, QMessageBox, QMenu,
     QAbstractItemView, QGroupBox, QCheckBox, QDoubleSpinBox, QSplitter, QToolTip
 )
-from PySide6.QtCore import Qt, QDate, Signal, QRect, QEvent, QLocale
-from PySide6.QtGui import QColor, QAction, QPainter, QTextCharFormat, QKeySequence, QShortcut
+from PySide6.QtCore import (
+    Qt, QDate, Signal, QRect, QEvent, QLocale, QAbstractTableModel, QModelIndex, QTimer
+)
+from PySide6.QtGui import (
+    QColor, QAction, QPainter, QPen, QTextCharFormat, QKeySequence, QShortcut, QFont
+)
 
 from app.domain.models import Task, TimeEntry
-from app.infra.repository import TaskRepository, TimeEntryRepository, UserRepository
+from app.infra.repository import (
+    TaskRepository, TimeEntryRepository, UserRepository, AccountingRepository
+)
 from app.ui.dialogs import ManualEntryDialog
 from app.ui.accounting_dialogs import AccountingManagementDialog
 from app.ui.task_dialogs import TaskManagementDialog
@@ -20,6 +30,18 @@ from app.ui.report_window import ReportWindow
 from app.infra.config import get_settings
 from app.services.calendar_service import CalendarService
 from app.i18n import tr, on_language_changed
+from app.utils import get_event_loop
+
+logger = logging.getLogger(__name__)
+
+# Colours shared by the calendar and the summary; built once, not per paint
+_HOLIDAY_FLAG_COLOR = QColor("#1565c0")
+_WARNING_COLOR = QColor("#d32f2f")
+_ACCENT_COLOR = QColor("#1976d2")
+_OVERTIME_COLOR = QColor("#f57c00")
+# Pens for the calendar's holiday flag and warning sign
+_HOLIDAY_FLAG_PEN = QPen(_HOLIDAY_FLAG_COLOR)
+_WARNING_PEN = QPen(_WARNING_COLOR)
 
 
 class StatusCalendarWidget(QCalendarWidget):
@@ -43,69 +65,95 @@ class StatusCalendarWidget(QCalendarWidget):
         STATE_HOLIDAY: QColor("#1976d2")       # Match Add Manual Entry button
     }
 
+    # Dark mode colors - slightly muted versions of button colors
+    DARK_COLORS = {
+        STATE_WORK: QColor("transparent"),
+        STATE_VACATION: QColor("#388E3C"),     # Darker green (based on #4CAF50)
+        STATE_SICKNESS: QColor("#c62828"),     # Dark red
+        STATE_HOLIDAY: QColor("#1565c0")       # Darker blue (based on #1976d2)
+    }
+    # Light mode colors - match button colors with transparency
+    LIGHT_COLORS = {
+        STATE_WORK: QColor("transparent"),
+        STATE_VACATION: QColor("#81C784"),     # Light green (based on #4CAF50)
+        STATE_SICKNESS: QColor("#ef9a9a"),     # Light red/pink
+        STATE_HOLIDAY: QColor("#64B5F6")       # Light blue (based on #1976d2)
+    }
+
     dateContextRequested = Signal(QDate)  # Right-click signal
 
+    # Shared empty format used to clear a date's formatting
+    _CLEAR_FMT = QTextCharFormat()
+    # Width reserved for the warning sign in a cell's top-right corner
+    WARNING_WIDTH = 18
+    # Glyphs drawn in a cell's corners and their alignment
+    HOLIDAY_GLYPH = "🏳"
+    WARNING_GLYPH = "⚠"
+    _HOLIDAY_GLYPH_ALIGN = Qt.AlignTop | Qt.AlignLeft
+    _WARNING_GLYPH_ALIGN = Qt.AlignTop | Qt.AlignRight
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.status_data: Dict[QDate, str] = {}
+        # Internal copies keyed by Julian day: int hashing is cheaper than
+        # QDate hashing in paintCell
+        self._status_by_day: Dict[int, str] = {}
         self.holiday_names: Dict[QDate, str] = {}  # Store holiday names for tooltips
         self._formatted_dates = set()
+        self._violations: Dict[QDate, List[str]] = {}
+        self._violation_days: frozenset = frozenset()
         self.setGridVisible(True)
         self.setVerticalHeaderFormat(QCalendarWidget.NoVerticalHeader)
 
-        # Style calendar cells: border highlight on hover/selection instead of background change
-        self.setStyleSheet("""
-            QCalendarWidget QAbstractItemView {
-                selection-background-color: transparent;
-                selection-color: palette(text);
-            }
-            QCalendarWidget QAbstractItemView::item:selected {
-                background-color: transparent;
-                border: 2px solid #1976d2;
-                color: palette(text);
-            }
-            QCalendarWidget QAbstractItemView::item:hover {
-                background-color: transparent;
-                border: 2px solid #90caf9;
-                color: palette(text);
-            }
-        """)
+        # Cell border highlight on hover/selection is styled in app.qss
+        self.setObjectName("statusCalendar")
 
         # Initialize theme-aware colors
+        self._is_dark: Optional[bool] = None
         self._update_theme_colors()
 
         # Install event filter on the internal table view to catch right-clicks
         # QCalendarWidget uses an internal QTableView to display the calendar
-        view = self.findChild(QAbstractItemView)
-        if view:
-            view.viewport().installEventFilter(self)
+        self._view = self.findChild(QAbstractItemView)
+        self._viewport = self._view.viewport() if self._view else None
+        if self._viewport:
+            self._viewport.installEventFilter(self)
+
+        # The date of the grid's first cell only changes with the shown page
+        self._grid_start_date = QDate()
+        self._recompute_grid_start()
+        self.currentPageChanged.connect(self._recompute_grid_start)
 
     def eventFilter(self, obj, event):
         """Filter events to catch right-clicks and tooltips on calendar cells"""
-        if event.type() == QEvent.MouseButtonPress:
+        if obj is not self._viewport:
+            return super().eventFilter(obj, event)
+        view = self._view
+
+        event_type = event.type()
+        if event_type == QEvent.MouseButtonPress:
             if event.button() == Qt.RightButton:
-                view = self.findChild(QAbstractItemView)
-                if view and obj == view.viewport():
-                    index = view.indexAt(event.position().toPoint())
-                    if index.isValid():
-                        date = self._get_date_from_index(index)
-                        if date.isValid():
-                            self.dateContextRequested.emit(date)
-                        return True  # Event handled
+                index = view.indexAt(event.position().toPoint())
+                if index.isValid():
+                    date = self._get_date_from_index(index)
+                    if date.isValid():
+                        self.dateContextRequested.emit(date)
+                    return True  # Event handled
 
         # Handle tooltip events for holidays
-        if event.type() == QEvent.ToolTip:
-            view = self.findChild(QAbstractItemView)
-            if view and obj == view.viewport():
+        elif event_type == QEvent.ToolTip:
+            # Months without holidays have no tooltip to look up
+            if self.holiday_names:
                 index = view.indexAt(event.pos())
                 if index.isValid():
                     date = self._get_date_from_index(index)
-                    if date.isValid() and date in self.holiday_names:
-                        holiday_name = self.holiday_names[date]
+                    holiday_name = self.holiday_names.get(date)
+                    if holiday_name:
                         QToolTip.showText(event.globalPos(), holiday_name, view)
                         return True
+            if QToolTip.isVisible():
                 QToolTip.hideText()
-                return True
+            return True
 
         return super().eventFilter(obj, event)
 
@@ -115,8 +163,15 @@ class StatusCalendarWidget(QCalendarWidget):
         if index.row() < 1:
             return QDate()
 
-        year = self.yearShown()
-        month = self.monthShown()
+        # Target date
+        # The internal QTableView of QCalendarWidget has a header row at row 0 (Day names)
+        # So the actual dates start at row 1. We must subtract 1 from the row index.
+        return self._grid_start_date.addDays((index.row() - 1) * 7 + index.column())
+
+    def _recompute_grid_start(self, year=None, month=None):
+        """Remember the date of the grid's first cell (0,0) for the shown month"""
+        if year is None:
+            year, month = self.yearShown(), self.monthShown()
 
         first_day_of_month = QDate(year, month, 1)
 
@@ -132,47 +187,71 @@ class StatusCalendarWidget(QCalendarWidget):
         if diff < 0:
             diff += 7
 
-        # Start date of the grid (cell 0,0)
-        start_date = first_day_of_month.addDays(-diff)
-
-        # Target date
-        # The internal QTableView of QCalendarWidget has a header row at row 0 (Day names)
-        # So the actual dates start at row 1. We must subtract 1 from the row index.
-        days_add = (index.row() - 1) * 7 + index.column()
-        return start_date.addDays(days_add)
+        self._grid_start_date = first_day_of_month.addDays(-diff)
 
     def set_status_data(self, data: Dict[QDate, str]):
         """Update the status data and refresh the calendar display"""
-        # Clear previous formatting
-        clear_format = QTextCharFormat()
-        for qdate in self._formatted_dates:
-            self.setDateTextFormat(qdate, clear_format)
-        self._formatted_dates.clear()
-
+        old_by_day = self._status_by_day
+        new_by_day = {qdate.toJulianDay(): state for qdate, state in data.items()}
         self.status_data = data
-        # Apply formatting for vacation/sickness
-        for qdate, state in self.status_data.items():
-            if state == self.STATE_WORK:
-                continue
-            fmt = QTextCharFormat()
-            fmt.setBackground(self.COLORS.get(state, self.COLORS[self.STATE_WORK]))
-            self.setDateTextFormat(qdate, fmt)
-            self._formatted_dates.add(qdate)
-        self.updateCells()
-        # Force immediate repaint of the whole window to ensure visual update
-        if self.window():
-            self.window().repaint()
+        # Unchanged data (e.g. a cached month shown again) needs no work
+        if new_by_day == old_by_day:
+            return
+        self._status_by_day = new_by_day
+
+        state_formats = self._state_formats
+        # Only states with a format (vacation/sickness/holiday) are formatted
+        formatted_dates = {
+            qdate for qdate, state in data.items() if state in state_formats
+        }
+        # Clear formatting only from dates that no longer have a status
+        for qdate in self._formatted_dates - formatted_dates:
+            self.setDateTextFormat(qdate, self._CLEAR_FMT)
+        self._formatted_dates = formatted_dates
+
+        # Apply formatting only to dates whose status changed
+        for qdate in formatted_dates:
+            state = data[qdate]
+            if old_by_day.get(qdate.toJulianDay()) != state:
+                self.setDateTextFormat(qdate, state_formats[state])
+
+        # Repaint only the cells whose status changed
+        for day in old_by_day.keys() | new_by_day.keys():
+            if old_by_day.get(day, self.STATE_WORK) != new_by_day.get(day, self.STATE_WORK):
+                self.updateCell(QDate.fromJulianDay(day))
+
+    def set_day_status(self, qdate: QDate, state: str):
+        """Change the status of a single day, repainting only its cell"""
+        data = dict(self.status_data)
+        if state == self.STATE_WORK:
+            data.pop(qdate, None)
+        else:
+            data[qdate] = state
+        self.set_status_data(data)
 
     def paintCell(self, painter: QPainter, rect: QRect, date: QDate):
         """Override to paint cell backgrounds based on day status"""
-        state = self.status_data.get(date, self.STATE_WORK)
+        status_by_day = self._status_by_day
+        violation_days = self._violation_days
+        # Months without any status or violation need no extra painting
+        if not status_by_day and not violation_days:
+            super().paintCell(painter, rect, date)
+            return
+
+        day = date.toJulianDay()
+        work = self.STATE_WORK
+        state = status_by_day.get(day, work)
+        has_violation = day in violation_days
+
+        # Plain work days (most cells) need no extra painting
+        if state == work and not has_violation:
+            super().paintCell(painter, rect, date)
+            return
 
         # Paint background color for vacation/sickness/holiday
-        if state != self.STATE_WORK:
-            painter.save()
-            color = self.COLORS.get(state, self.COLORS[self.STATE_WORK])
-            painter.fillRect(rect, color)
-            painter.restore()
+        # (fillRect leaves the painter state untouched, so no save/restore)
+        if state != work:
+            painter.fillRect(rect, self.COLORS.get(state, self._work_color))
 
         # Call parent to draw the date number
         super().paintCell(painter, rect, date)
@@ -180,17 +259,18 @@ class StatusCalendarWidget(QCalendarWidget):
         # Draw holiday flag icon if it's a holiday
         if state == self.STATE_HOLIDAY:
             painter.save()
-            painter.setPen(QColor("#1565c0"))
+            painter.setPen(_HOLIDAY_FLAG_PEN)
             # Draw flag emoji in top-left corner to indicate official holiday
-            painter.drawText(rect.adjusted(2, 2, 0, 0), Qt.AlignTop | Qt.AlignLeft, "🏳")
+            painter.drawText(rect.adjusted(2, 2, 0, 0), self._HOLIDAY_GLYPH_ALIGN, self.HOLIDAY_GLYPH)
             painter.restore()
 
         # Draw violation warning icon if exists
-        if hasattr(self, '_violations') and date in self._violations:
+        if has_violation:
             painter.save()
-            painter.setPen(QColor("#d32f2f"))
+            painter.setPen(_WARNING_PEN)
             # Draw warning triangle in top-right corner
-            painter.drawText(rect.adjusted(rect.width()-18, 2, 0, 0), Qt.AlignTop | Qt.AlignRight, "⚠")
+            painter.drawText(rect.adjusted(rect.width() - self.WARNING_WIDTH, 2, 0, 0),
+                             self._WARNING_GLYPH_ALIGN, self.WARNING_GLYPH)
             painter.restore()
 
     def set_holiday_names(self, holiday_names: Dict[QDate, str]):
@@ -200,7 +280,11 @@ class StatusCalendarWidget(QCalendarWidget):
     def set_violations(self, violations: Dict[QDate, List[str]]):
         """Set violations data for display"""
         self._violations = violations
-        self.updateCells()
+        # Snapshot the days: callers may keep mutating the same dict
+        violation_days = frozenset(qdate.toJulianDay() for qdate in violations)
+        for day in violation_days ^ self._violation_days:
+            self.updateCell(QDate.fromJulianDay(day))
+        self._violation_days = violation_days
 
     def _update_theme_colors(self):
         """Update colors based on current theme (dark or light mode)"""
@@ -209,36 +293,361 @@ class StatusCalendarWidget(QCalendarWidget):
         bg_color = palette.color(palette.ColorRole.Window)
         is_dark = bg_color.lightness() < 128
 
-        if is_dark:
-            # Dark mode colors - slightly muted versions of button colors
-            self.COLORS = {
-                self.STATE_WORK: QColor("transparent"),
-                self.STATE_VACATION: QColor("#388E3C"),     # Darker green (based on #4CAF50)
-                self.STATE_SICKNESS: QColor("#c62828"),     # Dark red
-                self.STATE_HOLIDAY: QColor("#1565c0")       # Darker blue (based on #1976d2)
-            }
-        else:
-            # Light mode colors - match button colors with transparency
-            self.COLORS = {
-                self.STATE_WORK: QColor("transparent"),
-                self.STATE_VACATION: QColor("#81C784"),     # Light green (based on #4CAF50)
-                self.STATE_SICKNESS: QColor("#ef9a9a"),     # Light red/pink
-                self.STATE_HOLIDAY: QColor("#64B5F6")       # Light blue (based on #1976d2)
-            }
+        # Colors and formats only depend on dark vs light
+        if is_dark == self._is_dark:
+            return
+        self._is_dark = is_dark
+        self.COLORS = self.DARK_COLORS if is_dark else self.LIGHT_COLORS
+
+        self._work_color = self.COLORS[self.STATE_WORK]
+
+        # One text format per status, shared by all dates with that status
+        self._state_formats: Dict[str, QTextCharFormat] = {}
+        for state, color in self.COLORS.items():
+            if state == self.STATE_WORK:
+                continue
+            fmt = QTextCharFormat()
+            fmt.setBackground(color)
+            self._state_formats[state] = fmt
+
+        # Dates formatted under the previous theme switch to the new formats
+        for qdate in self._formatted_dates:
+            self.setDateTextFormat(qdate, self._state_formats[self.status_data[qdate]])
 
     def changeEvent(self, event):
         """Handle theme changes"""
         if event.type() == QEvent.PaletteChange:
             self._update_theme_colors()
             self.updateCells()
+        elif event.type() == QEvent.LocaleChange:
+            self._recompute_grid_start()
         super().changeEvent(event)
 
 
+_LEGEND_CHIP_QSS = (
+    "background-color: {}; color: {}; "
+    "padding: 4px 8px; border-radius: 4px; margin-right: 5px;"
+)
+
+# Legend stylesheets per theme: vacation, sickness, holiday, hint
+_DARK_LEGEND_QSS = (
+    # Dark mode - use muted colors with light text
+    _LEGEND_CHIP_QSS.format("#1b5e20", "white"),
+    _LEGEND_CHIP_QSS.format("#b71c1c", "white"),
+    _LEGEND_CHIP_QSS.format("#1565c0", "white"),
+    "color: #999; font-style: italic; font-size: 11px;",
+)
+_LIGHT_LEGEND_QSS = (
+    # Light mode - match button colors
+    _LEGEND_CHIP_QSS.format("#81C784", "#1b5e20"),
+    _LEGEND_CHIP_QSS.format("#ef9a9a", "#b71c1c"),
+    _LEGEND_CHIP_QSS.format("#64B5F6", "#0d47a1"),
+    "color: #666; font-style: italic; font-size: 11px;",
+)
+
+
+@lru_cache(maxsize=64)
+def _format_long_date(julian_day: int, locale_name: str) -> str:
+    """Format a date (by Julian day) in the locale's long format"""
+    return QLocale(locale_name).toString(QDate.fromJulianDay(julian_day), QLocale.LongFormat)
+
+
+# Day state a task stands for, by lowercased task name; other tasks are work
+_DAY_STATE_BY_TASK_NAME = {
+    "vacation": StatusCalendarWidget.STATE_VACATION,
+    "sickness": StatusCalendarWidget.STATE_SICKNESS,
+}
+
+# Which day state wins when several apply: Sickness > Vacation > Holiday > Work
+_STATE_PRIORITY = {
+    StatusCalendarWidget.STATE_WORK: 0,
+    StatusCalendarWidget.STATE_HOLIDAY: 1,
+    StatusCalendarWidget.STATE_VACATION: 2,
+    StatusCalendarWidget.STATE_SICKNESS: 3,
+}
+
+
+class _DaySummary(NamedTuple):
+    """Aggregates of a day's entries, see _summarize_day()"""
+    durations: List[int]
+    task_totals: Dict[int, int]
+    name_by_id: Dict[int, str]
+    total_seconds: int
+    finished_seconds: int
+    active_starts: List[datetime]
+
+
+def _is_cacheable_day(day, entries: List[TimeEntry], today) -> bool:
+    """
+    Whether a loaded day's entries can be cached.
+
+    Today and days with a running entry (e.g. a timer started before
+    midnight) still change through the timer, so only finished past days
+    are cached.
+    """
+    return day < today and all(entry.end_time is not None for entry in entries)
+
+
+def _summarize_day(entries: List[TimeEntry], now: datetime) -> _DaySummary:
+    """
+    Aggregate a day's entries in one pass.
+
+    Touches no Qt objects, so it may run in a worker thread.
+    """
+    durations = []
+    task_totals = defaultdict(int)
+    # Entries carry their task name from the range query
+    name_by_id = {}
+    finished_seconds = 0
+    active_starts = []
+    for entry in entries:
+        if entry.end_time is None:
+            # For active tasks the DB duration stays 0 until stopped, so
+            # calculate it up to now
+            duration = int((now - entry.start_time).total_seconds())
+            active_starts.append(entry.start_time)
+        else:
+            duration = entry.duration_seconds
+            finished_seconds += duration
+        durations.append(duration)
+        task_totals[entry.task_id] += duration
+        if entry.task_name:
+            name_by_id[entry.task_id] = entry.task_name
+    return _DaySummary(
+        durations, task_totals, name_by_id, sum(durations), finished_seconds, active_starts
+    )
+
+
+def _format_duration(seconds: int) -> str:
+    """Format seconds as HH:MM, rounded to the nearest minute"""
+    # e.g. 1m 59s should show as 2m, not 1m
+    hours, minutes = divmod(round(seconds / 60), 60)
+    return f"{hours:02d}:{minutes:02d}"
+
+
+class EntriesModel(QAbstractTableModel):
+    """
+    Read-only model of the time entries shown for the selected day.
+
+    Rows are exposed to the view in pages through canFetchMore()/fetchMore(),
+    and each page's time and duration texts are formatted when it is added.
+    """
+
+    COLUMN_COUNT = 5
+    PAGE_SIZE = 200
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._entries: List[TimeEntry] = []
+        self._durations: List[int] = []
+        self._duration_texts: List[str] = []
+        self._time_texts: List[Tuple[str, str]] = []
+        self._headers: List[str] = []
+
+    def set_headers(self, headers: List[str]):
+        self._headers = headers
+        self.headerDataChanged.emit(Qt.Horizontal, 0, self.COLUMN_COUNT - 1)
+
+    def set_entries(self, entries: List[TimeEntry], durations: List[int]):
+        """Replace the entries; durations are in seconds, one per entry"""
+        self.beginResetModel()
+        self._entries = entries
+        self._durations = durations
+        self._duration_texts = []
+        self._time_texts = []
+        self._format_rows(min(len(entries), self.PAGE_SIZE))
+        self.endResetModel()
+
+    def is_showing(self, entries: List[TimeEntry], durations: List[int]) -> bool:
+        """Whether the model already holds exactly these entries and durations"""
+        return entries is self._entries and durations == self._durations
+
+    def _format_rows(self, count: int):
+        """Format the texts of the next count rows"""
+        start = len(self._time_texts)
+        stop = start + count
+        self._duration_texts.extend(
+            _format_duration(seconds) for seconds in self._durations[start:stop]
+        )
+        # Same output as strftime("%H:%M") without parsing the format per call
+        self._time_texts.extend(
+            (
+                f"{entry.start_time.hour:02d}:{entry.start_time.minute:02d}",
+                f"{entry.end_time.hour:02d}:{entry.end_time.minute:02d}"
+                if entry.end_time else "Active",
+            )
+            for entry in self._entries[start:stop]
+        )
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and len(self._time_texts) < len(self._entries)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        loaded = len(self._time_texts)
+        count = min(len(self._entries) - loaded, self.PAGE_SIZE)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), loaded, loaded + count - 1)
+        self._format_rows(count)
+        self.endInsertRows()
+
+    def entry_at(self, row: int) -> Optional[TimeEntry]:
+        if 0 <= row < len(self._time_texts):
+            return self._entries[row]
+        return None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._time_texts)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.COLUMN_COUNT
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+
+        row = index.row()
+        entry = self._entries[row]
+        column = index.column()
+        if column == 0:
+            return entry.task_name or "Unknown"
+        if column in (1, 2):
+            return self._time_texts[row][column - 1]
+        if column == 3:
+            return self._duration_texts[row]
+        return entry.notes or ""
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and section < len(self._headers):
+            return self._headers[section]
+        return None
+
+
+class SummaryModel(QAbstractTableModel):
+    """
+    Read-only model of the daily summary: one row per task, a Total row and,
+    when the daily target is exceeded, an Overtime row.
+    """
+
+    TOTAL_COLOR = _ACCENT_COLOR
+    LIMIT_COLOR = _WARNING_COLOR
+    OVERTIME_COLOR = _OVERTIME_COLOR
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._totals: List[Tuple[str, str]] = []
+        self._total_text = _format_duration(0)
+        self._limit_exceeded = False
+        self._overtime_seconds = 0
+        self._overtime_text = ""
+        self._headers: List[str] = []
+
+        self._total_font = QFont()
+        self._total_font.setBold(True)
+        self._overtime_font = QFont()
+        self._overtime_font.setItalic(True)
+
+    def set_headers(self, headers: List[str]):
+        self._headers = headers
+        self.headerDataChanged.emit(Qt.Horizontal, 0, 1)
+
+    def set_totals(self, totals: List[Tuple[str, int]], total_seconds: int):
+        """Replace the per-task totals; compliance state is reset"""
+        self.beginResetModel()
+        self._totals = [(name, _format_duration(seconds)) for name, seconds in totals]
+        self._total_text = _format_duration(total_seconds)
+        self._limit_exceeded = False
+        self._overtime_seconds = 0
+        self._overtime_text = ""
+        self.endResetModel()
+
+    def set_compliance(self, limit_exceeded: bool, overtime_seconds: int):
+        """Update the Total row highlight and the Overtime row"""
+        total_row = len(self._totals)
+        overtime_row = total_row + 1
+        had_overtime = self._overtime_seconds > 0
+        has_overtime = overtime_seconds > 0
+        hours, remainder = divmod(overtime_seconds, 3600)
+        overtime_text = f"+{hours:02d}:{remainder // 60:02d}" if has_overtime else ""
+
+        if had_overtime and not has_overtime:
+            self.beginRemoveRows(QModelIndex(), overtime_row, overtime_row)
+            self._overtime_seconds = 0
+            self._overtime_text = overtime_text
+            self.endRemoveRows()
+        elif has_overtime and not had_overtime:
+            self.beginInsertRows(QModelIndex(), overtime_row, overtime_row)
+            self._overtime_seconds = overtime_seconds
+            self._overtime_text = overtime_text
+            self.endInsertRows()
+        elif has_overtime:
+            # The row stays; repaint it only if its shown text changed
+            self._overtime_seconds = overtime_seconds
+            if overtime_text != self._overtime_text:
+                self._overtime_text = overtime_text
+                self.dataChanged.emit(self.index(overtime_row, 1), self.index(overtime_row, 1))
+
+        if self._limit_exceeded != limit_exceeded:
+            self._limit_exceeded = limit_exceeded
+            self.dataChanged.emit(self.index(total_row, 0), self.index(total_row, 1))
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._totals) + 1 + (1 if self._overtime_seconds > 0 else 0)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 2
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        column = index.column()
+        total_row = len(self._totals)
+
+        if row < total_row:
+            if role != Qt.DisplayRole:
+                return None
+            return self._totals[row][column]
+
+        if row == total_row:
+            if role == Qt.DisplayRole:
+                return "Total" if column == 0 else self._total_text
+            if role == Qt.ForegroundRole:
+                return self.LIMIT_COLOR if self._limit_exceeded else self.TOTAL_COLOR
+            if role == Qt.FontRole:
+                return self._total_font
+            return None
+
+        # Overtime row
+        if role == Qt.DisplayRole:
+            return "Overtime" if column == 0 else self._overtime_text
+        if role == Qt.ForegroundRole:
+            return self.OVERTIME_COLOR
+        if role == Qt.FontRole:
+            return self._overtime_font
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and section < len(self._headers):
+            return self._headers[section]
+        return None
+
+
 class HistoryWindow(QWidget):
     """
     Window to view daily time entries and add manual entries.
     """
 
+    ENTRY_CACHE_SIZE = 32
+    MONTH_CACHE_SIZE = 12
+    UNDO_LIMIT = 50
+    THREADED_SUMMARY_MIN_ENTRIES = 500
+
     def __init__(self, loop=None, parent=None):
         super().__init__(parent)
         self.setWindowTitle(tr("history.title"))
@@ -247,11 +656,13 @@ class HistoryWindow(QWidget):
         # Note: Global theme is managed by qdarktheme via SystemTrayApp
         # Only add minimal custom styling for specific elements that need it
 
-        self.loop = loop or asyncio.get_event_loop()
+        self.loop = loop or get_event_loop()
         self.entry_repo = TimeEntryRepository()
         self.task_repo = TaskRepository()
+        self.accounting_repo = AccountingRepository()
         self.settings = get_settings()
-        self.undo_stack = []
+        # Day snapshots for Ctrl+Z, oldest dropped first (see _push_undo)
+        self.undo_stack: deque = deque(maxlen=self.UNDO_LIMIT)
 
         # Initialize CalendarService for German holiday detection
         self.calendar_service = CalendarService(
@@ -261,12 +672,40 @@ class HistoryWindow(QWidget):
         )
 
         self.tasks: List[Task] = []
+        # Lookups derived from self.tasks, rebuilt by _set_tasks/_add_task:
+        # lowercased name -> task, and Vacation/Sickness task id -> day state
+        self._task_by_lower_name: Dict[str, Task] = {}
+        self._day_state_by_task_id: Dict[int, str] = {}
+        # Bumped whenever self.tasks changes
+        self._tasks_version = 0
+        # Shared manual entry dialog, created on first use
+        self._manual_dialog: Optional[ManualEntryDialog] = None
+        self._manual_dialog_tasks_version = -1
+        # Report wizard, created on first use and kept while it exists
+        self.report_window: Optional[ReportWindow] = None
         self.current_entries: List[TimeEntry] = []
+        # Split of the shown day's time for compliance checks: seconds of
+        # finished entries, and start times of entries still running
+        self._finished_seconds = 0
+        self._active_starts: List[datetime] = []
+        # Entries of past days keyed by date, least recently used first
+        self._entry_cache: OrderedDict = OrderedDict()
+        # Calendar status of past months keyed by (year, month), least
+        # recently used first
+        self._month_status_cache: OrderedDict = OrderedDict()
         self.month_violations: Dict[QDate, List[str]] = {}
+        # Month the calendar's status data belongs to; it lags behind the
+        # shown page while a month change is being debounced
+        self._status_month: Optional[Tuple[int, int]] = None
+        # Preferences last loaded for the regulations panel
+        self._prefs = None
+        # Keyed refresh tasks still running, see _run_async
+        self._inflight: Dict[str, asyncio.Task] = {}
 
         self._setup_ui()
-        self._load_tasks()
         self._load_regulations()
+        # Tasks and entries are loaded on first show, after the window paints
+        self._loaded = False
 
         self.undo_shortcut = QShortcut(QKeySequence("Ctrl+Z"), self)
         self.undo_shortcut.activated.connect(self._undo_last_change)
@@ -274,12 +713,74 @@ class HistoryWindow(QWidget):
         # Register for language changes
         on_language_changed(self._on_language_change)
 
-    def _run_async(self, coro):
-        """Helper to run coroutine whether loop is running or not"""
+    def _run_async(self, coro, on_done=None, on_error=None, key: Optional[str] = None):
+        """
+        Run a coroutine whether the loop is running or not.
+
+        When the loop is already running the coroutine is scheduled and the
+        callbacks fire once it finishes; otherwise it runs to completion here.
+
+        Args:
+            coro: Coroutine to run
+            on_done: Optional callback receiving the coroutine's result
+            on_error: Optional callback receiving the raised exception
+            key: Optional name of a refresh; a scheduled run with the same key
+                that has not finished yet is cancelled, so only the latest
+                request lands
+        """
         if self.loop.is_running():
-            self.loop.create_task(coro)
-        else:
-            self.loop.run_until_complete(coro)
+            if key is not None:
+                previous = self._inflight.get(key)
+                if previous is not None and not previous.done():
+                    previous.cancel()
+            task = self.loop.create_task(coro)
+            task.add_done_callback(lambda t: self._on_async_done(t, on_done, on_error))
+            if key is not None:
+                self._inflight[key] = task
+                task.add_done_callback(
+                    lambda t: self._inflight.pop(key, None) if self._inflight.get(key) is t else None
+                )
+            return
+
+        try:
+            result = self.loop.run_until_complete(coro)
+        except Exception as e:
+            if on_error is None:
+                raise
+            on_error(e)
+            return
+        if on_done:
+            on_done(result)
+
+    def _on_async_done(self, task, on_done, on_error):
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            if on_error:
+                on_error(error)
+            else:
+                logger.error(f"Background task failed: {error}", exc_info=error)
+        elif on_done:
+            on_done(task.result())
+
+    def showEvent(self, event):
+        """Load data the first time the window is shown"""
+        super().showEvent(event)
+        if not self._loaded:
+            self._loaded = True
+            QTimer.singleShot(0, self._load_tasks)
+
+    def hideEvent(self, event):
+        """Write pending regulation changes when the window is hidden or closed"""
+        self.flush_pending_save()
+        super().hideEvent(event)
+
+    def flush_pending_save(self):
+        """Public method to write a debounced regulation change right away"""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._do_save_regulations()
 
     def _on_language_change(self, lang):
         self.retranslate_ui()
@@ -300,7 +801,18 @@ class HistoryWindow(QWidget):
 
         self.calendar = StatusCalendarWidget()
         self.calendar.setGridVisible(True)
-        self.calendar.selectionChanged.connect(self._on_date_selected)
+        # Debounce selection changes so holding an arrow key doesn't fetch every day
+        self._date_select_timer = QTimer(self)
+        self._date_select_timer.setSingleShot(True)
+        self._date_select_timer.setInterval(120)
+        self._date_select_timer.timeout.connect(self._on_date_selected)
+        self.calendar.selectionChanged.connect(self._date_select_timer.start)
+        # Likewise collapse quick month paging into one status refresh
+        self._pending_month: Optional[Tuple[int, int]] = None
+        self._month_change_timer = QTimer(self)
+        self._month_change_timer.setSingleShot(True)
+        self._month_change_timer.setInterval(75)
+        self._month_change_timer.timeout.connect(self._refresh_pending_month)
         self.calendar.currentPageChanged.connect(self._on_month_changed)
         self.calendar.dateContextRequested.connect(self._cycle_day_status)
 
@@ -309,7 +821,7 @@ class HistoryWindow(QWidget):
         # Legend for day types
         legend_layout = QHBoxLayout()
         self.legend_label = QLabel(tr("history.legend"))
-        self.legend_label.setStyleSheet("font-weight: bold; margin-right: 10px;")
+        self.legend_label.setObjectName("historyLegendTitle")
         legend_layout.addWidget(self.legend_label)
 
         # Store legend labels for dynamic theme updates
@@ -327,6 +839,7 @@ class HistoryWindow(QWidget):
         legend_layout.addWidget(self.hint_label)
 
         # Apply initial theme-aware colors
+        self._legend_dark = None
         self._update_legend_colors()
 
         legend_layout.addStretch()
@@ -340,21 +853,7 @@ class HistoryWindow(QWidget):
         # Work Regulations Panel
         self.regulations_group = QGroupBox(tr("regulations.title"))
         self.regulations_group.setCheckable(False)
-        # Use minimal styling that works with both themes
-        self.regulations_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid palette(mid);
-                border-radius: 6px;
-                margin-top: 12px;
-                padding-top: 16px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
+        self.regulations_group.setObjectName("regulationsGroup")
         regulations_layout = QVBoxLayout(self.regulations_group)
         regulations_layout.setSpacing(8)
 
@@ -368,7 +867,12 @@ class HistoryWindow(QWidget):
         self.spin_work_hours.setSuffix(f" {tr('time.hours_short')}")
         self.spin_work_hours.setMinimumWidth(80)
         self.spin_work_hours.setValue(8.0)  # Default
-        self.spin_work_hours.valueChanged.connect(self._save_regulations)
+        # Coalesce bursts of edits (spinbox drags, several toggles) into one save
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(250)
+        self._save_timer.timeout.connect(self._do_save_regulations)
+        self.spin_work_hours.valueChanged.connect(self._save_timer.start)
         target_layout.addWidget(self.spin_work_hours)
         target_layout.addStretch()
         regulations_layout.addLayout(target_layout)
@@ -376,22 +880,22 @@ class HistoryWindow(QWidget):
         # Compliance Checks
         self.check_enable_compliance = QCheckBox(tr("regulations.enable_compliance"))
         self.check_enable_compliance.setToolTip("Warns when daily hours exceed 10 hours")
-        self.check_enable_compliance.stateChanged.connect(self._save_regulations)
+        self.check_enable_compliance.stateChanged.connect(self._save_timer.start)
         regulations_layout.addWidget(self.check_enable_compliance)
 
         self.check_breaks = QCheckBox(tr("regulations.check_breaks"))
         self.check_breaks.setToolTip("Warn if >6h without 30m break")
-        self.check_breaks.stateChanged.connect(self._save_regulations)
+        self.check_breaks.stateChanged.connect(self._save_timer.start)
         regulations_layout.addWidget(self.check_breaks)
 
         self.check_rest = QCheckBox(tr("regulations.check_rest"))
         self.check_rest.setToolTip("Warn if <11h between work days")
-        self.check_rest.stateChanged.connect(self._save_regulations)
+        self.check_rest.stateChanged.connect(self._save_timer.start)
         regulations_layout.addWidget(self.check_rest)
 
         # Violations display
         self.violations_label = QLabel()
-        self.violations_label.setStyleSheet("color: #d32f2f; font-weight: bold; padding: 5px;")
+        self.violations_label.setObjectName("violationsLabel")
         self.violations_label.setWordWrap(True)
         self.violations_label.hide()
         regulations_layout.addWidget(self.violations_label)
@@ -415,8 +919,10 @@ class HistoryWindow(QWidget):
         right_layout = QVBoxLayout()
 
         # Title for the table
-        self.date_label = QLabel(QDate.currentDate().toString("dddd, MMMM d, yyyy"))
-        self.date_label.setStyleSheet("font-size: 18px; font-weight: bold; margin-bottom: 5px;")
+        self.date_label = QLabel()
+        self.date_label.setObjectName("historyDateLabel")
+        self._date_label_key = None
+        self._update_date_label(self.calendar.selectedDate())
         right_layout.addWidget(self.date_label)
 
         # Create splitter for task table and daily summary
@@ -428,26 +934,37 @@ class HistoryWindow(QWidget):
         task_table_layout.setContentsMargins(0, 0, 0, 0)
 
         # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels([
+        self.entries_model = EntriesModel(self)
+        self.entries_model.set_headers([
             tr("history.task"), tr("history.start"), tr("history.end"),
             tr("history.duration"), tr("history.notes")
         ])
+        self.table = QTableView()
+        self.table.setModel(self.entries_model)
         self.table.verticalHeader().setVisible(False)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
 
         # Context Menu
         self.table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self._show_context_menu)
+        # Built once and reused for every right-click
+        self._context_menu = QMenu(self)
+        self._edit_action = QAction(tr("action.edit"), self)
+        self._edit_action.triggered.connect(self._edit_current_entry)
+        self._delete_action = QAction(tr("action.delete"), self)
+        self._delete_action.triggered.connect(self._delete_current_entry)
+        self._context_menu.addAction(self._edit_action)
+        self._context_menu.addAction(self._delete_action)
 
         # Configure header
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Stretch) # Task name
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents) # Start
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents) # End
-        header.setSectionResizeMode(3, QHeaderView.ResizeToContents) # Duration
+        # Time columns have fixed-format content, so size them from font
+        # metrics (see _apply_column_widths) instead of measuring every row
+        header.setSectionResizeMode(1, QHeaderView.Fixed) # Start
+        header.setSectionResizeMode(2, QHeaderView.Fixed) # End
+        header.setSectionResizeMode(3, QHeaderView.Fixed) # Duration
         header.setSectionResizeMode(4, QHeaderView.Stretch) # Notes
 
         task_table_layout.addWidget(self.table)
@@ -456,24 +973,7 @@ class HistoryWindow(QWidget):
         self.add_btn = QPushButton(f"+ {tr('history.add_entry')}")
         self.add_btn.clicked.connect(self._open_manual_entry)
         self.add_btn.setCursor(Qt.PointingHandCursor)
-        self.add_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #1976d2;
-                color: white;
-                font-weight: bold;
-                border-radius: 6px;
-                padding: 10px 20px;
-                font-size: 14px;
-                border: none;
-                margin-top: 10px;
-            }
-            QPushButton:hover {
-                background-color: #1565c0;
-            }
-            QPushButton:pressed {
-                background-color: #0d47a1;
-            }
-        """)
+        self.add_btn.setObjectName("addEntryButton")
         task_table_layout.addWidget(self.add_btn)
 
         splitter.addWidget(task_table_widget)
@@ -485,21 +985,24 @@ class HistoryWindow(QWidget):
 
         # Daily Summary Section
         self.summary_header = QLabel(tr("history.daily_summary"))
-        self.summary_header.setStyleSheet("font-size: 14px; font-weight: bold; margin-bottom: 5px;")
+        self.summary_header.setObjectName("historySummaryHeader")
         summary_layout.addWidget(self.summary_header)
 
-        self.summary_table = QTableWidget()
-        self.summary_table.setColumnCount(2)
-        self.summary_table.setHorizontalHeaderLabels([tr("history.task"), tr("history.duration")])
+        self.summary_model = SummaryModel(self)
+        self._last_summary_sig = None
+        self.summary_model.set_headers([tr("history.task"), tr("history.duration")])
+        self.summary_table = QTableView()
+        self.summary_table.setModel(self.summary_model)
         self.summary_table.verticalHeader().setVisible(False)
-        self.summary_table.setSelectionMode(QTableWidget.NoSelection)
-        self.summary_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.summary_table.setSelectionMode(QAbstractItemView.NoSelection)
+        self.summary_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.summary_table.setFocusPolicy(Qt.NoFocus)
 
         # Header setup
         summary_header = self.summary_table.horizontalHeader()
         summary_header.setSectionResizeMode(0, QHeaderView.Stretch)
-        summary_header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
+        summary_header.setSectionResizeMode(1, QHeaderView.Fixed)
+        self._apply_column_widths()
 
         summary_layout.addWidget(self.summary_table)
         splitter.addWidget(summary_widget)
@@ -516,60 +1019,18 @@ class HistoryWindow(QWidget):
 
         self.accounting_btn = QPushButton(tr("history.manage_accounting"))
         self.accounting_btn.clicked.connect(self._open_accounting)
-        self.accounting_btn.setStyleSheet("""
-            QPushButton {
-                 background-color: #f5f5f5;
-                 color: #333;
-                 border: 1px solid #ccc;
-                 border-radius: 6px;
-                 padding: 10px 20px;
-                 font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #e0e0e0;
-            }
-        """)
-
-
+        self.accounting_btn.setObjectName("manageAccountingButton")
 
         self.tasks_btn = QPushButton(tr("history.manage_tasks"))
         self.tasks_btn.clicked.connect(self._open_tasks)
-        self.tasks_btn.setStyleSheet("""
-            QPushButton {
-                 background-color: #f5f5f5;
-                 color: #333;
-                 border: 1px solid #ccc;
-                 border-radius: 6px;
-                 padding: 10px 20px;
-                 font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #e0e0e0;
-            }
-        """)
+        self.tasks_btn.setObjectName("manageTasksButton")
 
         btn_layout.addWidget(self.accounting_btn)
         btn_layout.addWidget(self.tasks_btn)
 
         self.report_btn = QPushButton(f"📊 {tr('history.generate_report')}")
         self.report_btn.clicked.connect(self._generate_report)
-        self.report_btn.setStyleSheet("""
-            QPushButton {
-                 background-color: #4CAF50;
-                 color: white;
-                 font-weight: bold;
-                 border: none;
-                 border-radius: 6px;
-                 padding: 10px 20px;
-                 font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-        """)
+        self.report_btn.setObjectName("generateReportButton")
         btn_layout.addWidget(self.report_btn)
 
         btn_layout.addStretch()
@@ -577,43 +1038,25 @@ class HistoryWindow(QWidget):
         right_layout.addLayout(btn_layout)
         layout.addLayout(right_layout, stretch=3) # Make right side wider
 
-    def retranslate_ui(self):
-        """Update UI strings on language change"""
-        self.setWindowTitle(tr("history.title"))
+    def _apply_column_widths(self):
+        """Size the fixed time columns to fit their header and widest value"""
+        cell_metrics = self.table.fontMetrics()
+        header_metrics = self.table.horizontalHeader().fontMetrics()
+        padding = 20
 
-        # Legend
-        self.legend_label.setText(tr("history.legend"))
-        self.vacation_legend.setText(f"  {tr('status.vacation')}  ")
-        self.sickness_legend.setText(f"  {tr('status.sickness')}  ")
-        self.holiday_legend.setText(f"  🏳 {tr('status.holiday')}  ")
-        self.hint_label.setText(tr("history.legend_hint"))
-
-        # Regulations
-        self.regulations_group.setTitle(tr("regulations.title"))
-        self.label_daily_target.setText(tr("regulations.daily_target"))
-        self.spin_work_hours.setSuffix(f" {tr('time.hours_short')}")
-        self.check_enable_compliance.setText(tr("regulations.enable_compliance"))
-        self.check_breaks.setText(tr("regulations.check_breaks"))
-        self.check_rest.setText(tr("regulations.check_rest"))
-
-        # Tables
-        self.table.setHorizontalHeaderLabels([
-            tr("history.task"), tr("history.start"), tr("history.end"),
-            tr("history.duration"), tr("history.notes")
-        ])
-
-        self.summary_header.setText(tr("history.daily_summary"))
-        self.summary_table.setHorizontalHeaderLabels([tr("history.task"), tr("history.duration")])
+        def width(header_text, *samples):
+            return max(
+                header_metrics.horizontalAdvance(header_text),
+                *(cell_metrics.horizontalAdvance(sample) for sample in samples)
+            ) + padding
 
-        # Buttons
-        self.add_btn.setText(f"+ {tr('history.add_entry')}")
-        self.accounting_btn.setText(tr("history.manage_accounting"))
-        self.tasks_btn.setText(tr("history.manage_tasks"))
-        self.report_btn.setText(f"📊 {tr('history.generate_report')}")
-
-        # Update date label format
-        if hasattr(self, 'calendar'):
-             self._on_date_selected()
+        header = self.table.horizontalHeader()
+        header.resizeSection(1, width(tr("history.start"), "00:00"))
+        header.resizeSection(2, width(tr("history.end"), "00:00", "Active"))
+        header.resizeSection(3, width(tr("history.duration"), "00:00"))
+        self.summary_table.horizontalHeader().resizeSection(
+            1, width(tr("history.duration"), "00:00", "+00:00")
+        )
 
     def _is_dark_mode(self) -> bool:
         """Detect if dark mode is active based on palette"""
@@ -624,47 +1067,24 @@ class HistoryWindow(QWidget):
     def _update_legend_colors(self):
         """Update legend colors based on current theme"""
         is_dark = self._is_dark_mode()
+        if is_dark == self._legend_dark:
+            return
+        self._legend_dark = is_dark
 
-        if is_dark:
-            # Dark mode - use muted colors with light text
-            vacation_style = (
-                "background-color: #1b5e20; color: white; "
-                "padding: 4px 8px; border-radius: 4px; margin-right: 5px;"
-            )
-            sickness_style = (
-                "background-color: #b71c1c; color: white; "
-                "padding: 4px 8px; border-radius: 4px; margin-right: 5px;"
-            )
-            holiday_style = (
-                "background-color: #1565c0; color: white; "
-                "padding: 4px 8px; border-radius: 4px; margin-right: 5px;"
-            )
-            hint_style = "color: #999; font-style: italic; font-size: 11px;"
-        else:
-            # Light mode - match button colors
-            vacation_style = (
-                "background-color: #81C784; color: #1b5e20; "
-                "padding: 4px 8px; border-radius: 4px; margin-right: 5px;"
-            )
-            sickness_style = (
-                "background-color: #ef9a9a; color: #b71c1c; "
-                "padding: 4px 8px; border-radius: 4px; margin-right: 5px;"
-            )
-            holiday_style = (
-                "background-color: #64B5F6; color: #0d47a1; "
-                "padding: 4px 8px; border-radius: 4px; margin-right: 5px;"
-            )
-            hint_style = "color: #666; font-style: italic; font-size: 11px;"
-
+        vacation_style, sickness_style, holiday_style, hint_style = (
+            _DARK_LEGEND_QSS if is_dark else _LIGHT_LEGEND_QSS
+        )
         self.vacation_legend.setStyleSheet(vacation_style)
         self.sickness_legend.setStyleSheet(sickness_style)
         self.holiday_legend.setStyleSheet(holiday_style)
         self.hint_label.setStyleSheet(hint_style)
 
     def changeEvent(self, event):
-        """Handle theme changes"""
+        """Handle theme and font changes"""
         if event.type() == QEvent.PaletteChange:
             self.update_theme()
+        elif event.type() == QEvent.FontChange:
+            self._apply_column_widths()
         super().changeEvent(event)
 
     def update_theme(self):
@@ -677,12 +1097,15 @@ class HistoryWindow(QWidget):
 
     def _open_accounting(self):
         """Open accounting management dialog"""
-        dialog = AccountingManagementDialog(self)
+        dialog = AccountingManagementDialog(
+            self, loop=self.loop, repo=self.accounting_repo, user_repo=self.user_repo
+        )
         dialog.exec()
 
     def _open_tasks(self):
         """Open task management dialog"""
-        dialog = TaskManagementDialog(self)
+        dialog = TaskManagementDialog(self, repo=self.task_repo, acc_repo=self.accounting_repo,
+                                      loop=self.loop)
         dialog.exec()
         # Refresh tasks regardless of result since dialog auto-saves changes
         self._load_tasks()
@@ -693,48 +1116,94 @@ class HistoryWindow(QWidget):
             # Get current month/year from calendar
             current_date = self.calendar.selectedDate()
 
-            # Create report window and set it to the current month
-            self.report_window = ReportWindow()
-            self.report_window._set_period(current_date.year(), current_date.month())
+            # Create the report window once; closing it only hides it
+            if self.report_window is None:
+                window = self.report_window = ReportWindow()
+                window.destroyed.connect(lambda: self._forget_report_window(window))
+                # A fresh window already starts clean
+                self.report_window._set_period(current_date.year(), current_date.month())
+            else:
+                # Clear the previous run's status, path and settings
+                self.report_window.prepare(current_date.year(), current_date.month())
             self.report_window.show()
+            self.report_window.raise_()
+            self.report_window.activateWindow()
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to open report wizard:\n{e}")
 
+    def _forget_report_window(self, window):
+        """Drop the cached report window once it is destroyed"""
+        # A replacement may already be cached (e.g. after a language change)
+        if self.report_window is window:
+            self.report_window = None
+
     def _load_regulations(self):
         """Load work regulations from preferences"""
+        self._run_async(
+            self.user_repo.get_preferences(),
+            on_done=self._apply_regulations,
+            on_error=lambda e: print(f"Failed to load regulations: {e}")
+        )
+
+    def _apply_regulations(self, prefs):
+        """Show loaded work regulations in the panel"""
+        self._prefs = prefs
+        widgets = (self.spin_work_hours, self.check_enable_compliance,
+                   self.check_breaks, self.check_rest)
+        # Prevent saving while loading
+        for widget in widgets:
+            widget.blockSignals(True)
         try:
-            prefs = self.loop.run_until_complete(self.user_repo.get_preferences())
             self.spin_work_hours.setValue(prefs.work_hours_per_day)
             self.check_enable_compliance.setChecked(prefs.enable_german_compliance)
             self.check_breaks.setChecked(prefs.check_breaks)
             self.check_rest.setChecked(prefs.check_rest_periods)
-        except Exception as e:
-            print(f"Failed to load regulations: {e}")
+        finally:
+            for widget in widgets:
+                widget.blockSignals(False)
+        self._check_violations()
 
-    def _save_regulations(self):
+    def _do_save_regulations(self):
         """Save work regulations to preferences"""
-        try:
-            prefs = self.loop.run_until_complete(self.user_repo.get_preferences())
-            prefs.work_hours_per_day = self.spin_work_hours.value()
-            prefs.enable_german_compliance = self.check_enable_compliance.isChecked()
-            prefs.check_breaks = self.check_breaks.isChecked()
-            prefs.check_rest_periods = self.check_rest.isChecked()
-            self.loop.run_until_complete(self.user_repo.update_preferences(prefs))
-            self._check_violations()
-        except Exception as e:
-            print(f"Failed to save regulations: {e}")
+        # Read the widgets now; they may change before the save runs
+        values = (
+            self.spin_work_hours.value(),
+            self.check_enable_compliance.isChecked(),
+            self.check_breaks.isChecked(),
+            self.check_rest.isChecked(),
+        )
+        prefs = self._prefs
+        # Toggling a value back and forth within the debounce window
+        # leaves nothing to write
+        if prefs is not None and values == (
+            prefs.work_hours_per_day, prefs.enable_german_compliance,
+            prefs.check_breaks, prefs.check_rest_periods,
+        ):
+            return
+        self._run_async(
+            self._store_regulations(*values),
+            on_done=lambda _: self._check_violations(),
+            on_error=lambda e: print(f"Failed to save regulations: {e}")
+        )
+
+    async def _store_regulations(self, work_hours: float, compliance: bool,
+                                 breaks: bool, rest_periods: bool):
+        prefs = self._prefs
+        if prefs is None:
+            prefs = self._prefs = await self.user_repo.get_preferences()
+        prefs.work_hours_per_day = work_hours
+        prefs.enable_german_compliance = compliance
+        prefs.check_breaks = breaks
+        prefs.check_rest_periods = rest_periods
+        await self.user_repo.update_preferences(prefs)
 
     def _check_violations(self):
         """Check for work regulation violations on current date"""
-        # Calculate total hours including active entries (same logic as _populate_tables)
-        total_seconds = 0
-        for entry in self.current_entries:
-            if entry.end_time is None:
-                # Active entry - calculate duration up to now
-                duration = int((datetime.now() - entry.start_time).total_seconds())
-            else:
-                duration = entry.duration_seconds
-            total_seconds += duration
+        # Total including active entries (same durations as the tables)
+        now = datetime.now()
+        total_seconds = self._finished_seconds + sum(
+            int((now - start).total_seconds()) for start in self._active_starts
+        )
 
         total_hours = total_seconds / 3600.0
         violations = []
@@ -755,54 +1224,8 @@ class HistoryWindow(QWidget):
             if over_hours > 2.0:  # Only warn if significantly over
                 violations.append(f"📊 {over_hours:.1f}h over daily target ({target:.1f}h)")
 
-        # Remove existing Overtime row FIRST (to prevent duplication)
-        row_count = self.summary_table.rowCount()
-        if row_count > 1:
-            last_row_item = self.summary_table.item(row_count - 1, 0)
-            if last_row_item and last_row_item.text() == "Overtime":
-                self.summary_table.removeRow(row_count - 1)
-                row_count -= 1  # Update count after removal
-
-        # Color the Total row RED if 10h limit exceeded
-        # Now row_count-1 is guaranteed to be Total row
-        if row_count > 0:
-            total_row = row_count - 1
-
-            total_name_item = self.summary_table.item(total_row, 0)
-            total_dur_item = self.summary_table.item(total_row, 1)
-
-            if total_name_item and total_dur_item:
-                if limit_exceeded:
-                    # Mark Total RED for 10h limit violation
-                    total_name_item.setForeground(QColor("#d32f2f"))
-                    total_dur_item.setForeground(QColor("#d32f2f"))
-                else:
-                    # Normal blue color
-                    total_name_item.setForeground(QColor("#1976d2"))
-                    total_dur_item.setForeground(QColor("#1976d2"))
-
-        # Add Overtime row if target exceeded (only info, not a violation warning)
-        if overtime_seconds > 0:
-            # Add an extra row for overtime
-            current_rows = self.summary_table.rowCount()
-            self.summary_table.setRowCount(current_rows + 1)
-
-            overtime_row = current_rows
-            overtime_name_item = QTableWidgetItem("Overtime")
-            overtime_name_item.setForeground(QColor("#f57c00"))  # Orange color for info
-            font = overtime_name_item.font()
-            font.setItalic(True)
-            overtime_name_item.setFont(font)
-            self.summary_table.setItem(overtime_row, 0, overtime_name_item)
-
-            hours, remainder = divmod(overtime_seconds, 3600)
-            minutes, seconds = divmod(remainder, 60)
-            overtime_dur_str = f"+{hours:02d}:{minutes:02d}"
-
-            overtime_dur_item = QTableWidgetItem(overtime_dur_str)
-            overtime_dur_item.setForeground(QColor("#f57c00"))
-            overtime_dur_item.setFont(font)
-            self.summary_table.setItem(overtime_row, 1, overtime_dur_item)
+        # Color the Total row and show/hide the Overtime row
+        self.summary_model.set_compliance(limit_exceeded, overtime_seconds)
 
         # Update violations label
         if violations:
@@ -813,13 +1236,10 @@ class HistoryWindow(QWidget):
 
         # Store violation for this date for calendar display
         selected_date = self.calendar.selectedDate()
-        if not hasattr(self, 'month_violations'):
-            self.month_violations = {}
-
         if violations:
             self.month_violations[selected_date] = violations
-        elif selected_date in self.month_violations:
-            del self.month_violations[selected_date]
+        else:
+            self.month_violations.pop(selected_date, None)
 
         # Pass violations data to calendar
         self.calendar.set_violations(self.month_violations)
@@ -831,39 +1251,31 @@ class HistoryWindow(QWidget):
         if not index.isValid():
             return
 
-        menu = QMenu(self)
-        edit_action = QAction(tr("action.edit"), self)
-        delete_action = QAction(tr("action.delete"), self)
-
-        edit_action.triggered.connect(self._edit_current_entry)
-        delete_action.triggered.connect(self._delete_current_entry)
-
-        menu.addAction(edit_action)
-        menu.addAction(delete_action)
-        menu.exec(self.table.mapToGlobal(pos))
+        # pos is in viewport coordinates, as indexAt() expects
+        self._context_menu.exec(self.table.viewport().mapToGlobal(pos))
 
     def _edit_current_entry(self):
         """Edit the currently selected entry"""
-        row = self.table.currentRow()
+        row = self.table.currentIndex().row()
         if row < 0 or row >= len(self.current_entries):
             return
 
         entry = self.current_entries[row]
 
-        dialog = ManualEntryDialog(self.tasks, self)
+        dialog = self._get_manual_dialog()
         dialog.set_data(entry)
 
         if dialog.exec():
             data = dialog.get_data()
-            try:
-                self.loop.run_until_complete(self._update_entry(entry, data))
-                self._on_date_selected() # Refresh
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to update entry: {e}")
+            self._run_async(
+                self._update_entry(entry, data),
+                on_done=lambda _: self._refresh_after_write(),
+                on_error=lambda e: QMessageBox.critical(self, "Error", f"Failed to update entry: {e}")
+            )
 
     def _delete_current_entry(self):
         """Delete the currently selected entry"""
-        row = self.table.currentRow()
+        row = self.table.currentIndex().row()
         if row < 0 or row >= len(self.current_entries):
             return
 
@@ -878,25 +1290,36 @@ class HistoryWindow(QWidget):
         entry = self.current_entries[row]
 
         # Save state for undo
-        try:
-            qdate = self.calendar.selectedDate()
-            start = datetime(qdate.year(), qdate.month(), qdate.day())
-            end = datetime(qdate.year(), qdate.month(), qdate.day(), 23, 59, 59)
-
-            self.undo_stack.append({
-                "start": start,
-                "end": end,
-                "entries": list(self.current_entries)
-            })
-
-            self.loop.run_until_complete(self.entry_repo.delete(entry.id))
-            self._on_date_selected()  # Refresh
-        except Exception as e:
-            QMessageBox.critical(self, tr("error"), f"{tr('history.delete_failed')}: {e}")
+        qdate = self.calendar.selectedDate()
+        start = datetime(qdate.year(), qdate.month(), qdate.day())
+        end = datetime(qdate.year(), qdate.month(), qdate.day(), 23, 59, 59)
+
+        self._push_undo(start, end, self.current_entries)
+
+        def on_deleted(_):
+            self._invalidate_entry_cache(entry)
+            self._refresh_after_write()
+
+        self._run_async(
+            self.entry_repo.delete(entry.id),
+            on_done=on_deleted,
+            on_error=lambda e: QMessageBox.critical(
+                self, tr("error"), f"{tr('history.delete_failed')}: {e}"
+            )
+        )
 
     def retranslate_ui(self):
         """Update strings when language changes"""
         self.setWindowTitle(tr("history.title"))
+        # The cached manual entry dialog is rebuilt lazily in the new language
+        if self._manual_dialog is not None:
+            self._manual_dialog.deleteLater()
+            self._manual_dialog = None
+        # The report window has no retranslate path; it is rebuilt on next use
+        if self.report_window is not None:
+            self.report_window.close()
+            self.report_window.deleteLater()
+            self.report_window = None
         self.legend_label.setText(tr("history.legend"))
         self.vacation_legend.setText(f"  {tr('status.vacation')}  ")
         self.sickness_legend.setText(f"  {tr('status.sickness')}  ")
@@ -905,18 +1328,22 @@ class HistoryWindow(QWidget):
 
         self.regulations_group.setTitle(tr("regulations.title"))
         self.label_daily_target.setText(tr("regulations.daily_target"))
+        self.spin_work_hours.setSuffix(f" {tr('time.hours_short')}")
         self.check_enable_compliance.setText(tr("regulations.enable_compliance"))
         self.check_breaks.setText(tr("regulations.check_breaks"))
         self.check_rest.setText(tr("regulations.check_rest"))
 
-        self.table.setHorizontalHeaderLabels([
+        self.entries_model.set_headers([
             tr("history.task"), tr("history.start"), tr("history.end"),
             tr("history.duration"), tr("history.notes")
         ])
         self.add_btn.setText(f"+ {tr('history.add_entry')}")
+        self._edit_action.setText(tr("action.edit"))
+        self._delete_action.setText(tr("action.delete"))
 
         self.summary_header.setText(tr("history.daily_summary"))
-        self.summary_table.setHorizontalHeaderLabels([tr("history.task"), tr("history.duration")])
+        self.summary_model.set_headers([tr("history.task"), tr("history.duration")])
+        self._apply_column_widths()
 
         self.accounting_btn.setText(tr("history.manage_accounting"))
         self.tasks_btn.setText(tr("history.manage_tasks"))
@@ -929,6 +1356,8 @@ class HistoryWindow(QWidget):
 
     def refresh_data(self):
         """Public method to refresh all data (called after backup restore)"""
+        self.accounting_repo.invalidate_cache()
+        self._load_regulations()
         self._load_tasks()
 
     def _load_tasks(self):
@@ -938,77 +1367,170 @@ class HistoryWindow(QWidget):
                 await self._fetch_tasks()
                 # After tasks are loaded, load entries for today
                 # Explicitly await instead of using _on_date_selected() which spawns a background task
-                self.date_label.setText(QLocale().toString(self.calendar.selectedDate(), QLocale.LongFormat))
-                await self._refresh_current_date_entries()
-                # Load month status for calendar coloring
+                self._update_date_label(self.calendar.selectedDate())
+                # The day's entries and the month status (for calendar
+                # coloring) are independent once tasks are known
                 today = QDate.currentDate()
-                await self._refresh_month_status(today.year(), today.month())
+                await asyncio.gather(
+                    self._refresh_current_date_entries(),
+                    self._refresh_month_status(today.year(), today.month())
+                )
             except Exception as e:
                 print(f"Error loading tasks: {e}")
 
         self._run_async(sequence())
 
     async def _fetch_tasks(self):
-        self.tasks = await self.task_repo.get_all_active()
+        self._set_tasks(await self.task_repo.get_all_active())
+        # Cached days were filtered by the previous task list
+        self._clear_entry_caches()
+
+    def _set_tasks(self, tasks: List[Task]):
+        """Replace the task list and rebuild the lookups derived from it"""
+        self.tasks = tasks
+        self._task_by_lower_name = {}
+        self._day_state_by_task_id = {}
+        for task in tasks:
+            self._index_task(task)
+        self._tasks_version += 1
+
+    def _add_task(self, task: Task):
+        """Track a task created by this window"""
+        self.tasks.append(task)
+        self._index_task(task)
+        self._tasks_version += 1
+
+    def _index_task(self, task: Task):
+        lower_name = task.name.lower()
+        self._task_by_lower_name[lower_name] = task
+        day_state = _DAY_STATE_BY_TASK_NAME.get(lower_name)
+        if day_state:
+            self._day_state_by_task_id[task.id] = day_state
+
+    def _get_manual_dialog(self) -> ManualEntryDialog:
+        """Return the shared manual entry dialog, reset and with current tasks"""
+        if self._manual_dialog is None:
+            self._manual_dialog = ManualEntryDialog(self.tasks, self)
+        else:
+            if self._manual_dialog_tasks_version != self._tasks_version:
+                self._manual_dialog.set_tasks(self.tasks)
+            self._manual_dialog.reset()
+        self._manual_dialog_tasks_version = self._tasks_version
+        return self._manual_dialog
 
     def _on_month_changed(self, year, month):
         """Fetch status data when calendar page changes"""
-        self._run_async(self._refresh_month_status(year, month))
+        self._pending_month = (year, month)
+        self._month_change_timer.start()
+
+    def _refresh_pending_month(self):
+        year, month = self._pending_month
+        self._run_async(self._refresh_month_status(year, month), key="month")
 
     async def _refresh_month_status(self, year, month):
         """Load status (Work/Vacation/Sickness/Holiday) for the whole month"""
+        key = (year, month)
+        cached = self._month_status_cache.get(key)
+        if cached is None:
+            start_date, end_date = self._month_range(year, month)
+            month_entries = await self._fetch_entries(start_date, end_date)
+            self._show_month_status(year, month, month_entries)
+        else:
+            self._month_status_cache.move_to_end(key)
+            self._apply_month_status(year, month, cached)
+
+    def _refresh_after_write(self):
+        """Refresh the shown month's status and the selected day after an entry write"""
+        # Own key: a later day click must not cancel the month status update.
+        # The day part reads the selection after the month query, so it
+        # still shows whichever day is selected by then.
+        self._run_async(
+            self._refresh_month_and_day(self.calendar.yearShown(), self.calendar.monthShown()),
+            key="write"
+        )
+
+    async def _refresh_month_and_day(self, year, month):
+        """
+        Refresh the month status and the selected day after a write.
+
+        One month query serves both when the selected day is in that month.
+        """
+        start_date, end_date = self._month_range(year, month)
+        month_entries = await self._fetch_entries(start_date, end_date)
+        self._show_month_status(year, month, month_entries)
+
+        py_date = self.calendar.selectedDate().toPython()
+        if (py_date.year, py_date.month) != (year, month):
+            await self._refresh_current_date_entries()
+            return
+
+        # Same overlap rule as the range query, applied to the selected day
+        day_start = datetime.combine(py_date, time.min)
+        day_end = day_start + timedelta(days=1)
+        day_entries = [
+            entry for entry in month_entries
+            if entry.start_time < day_end and (
+                entry.start_time >= day_start if entry.end_time is None
+                else entry.end_time > day_start
+            )
+        ]
+        self._show_day_entries(py_date, day_entries)
+
+    @staticmethod
+    def _month_range(year, month) -> Tuple[datetime, datetime]:
+        """Half-open [first day, first day of next month) range of a month"""
         start_date = datetime(year, month, 1)
         last_day = calendar.monthrange(year, month)[1]
-        end_date = datetime(year, month, last_day, 23, 59, 59)
+        return start_date, start_date + timedelta(days=last_day)
+
+    def _show_month_status(self, year, month, month_entries: List[TimeEntry]):
+        """Compute, cache and show the month status from its entries"""
+        result = self._compute_month_status(year, month, month_entries)
+        # The current month and months with a running entry can still
+        # change through the timer, so only finished past months are cached
+        today = datetime.now().date()
+        if (year, month) < (today.year, today.month) and all(
+            entry.end_time is not None for entry in month_entries
+        ):
+            self._month_status_cache[(year, month)] = result
+            if len(self._month_status_cache) > self.MONTH_CACHE_SIZE:
+                self._month_status_cache.popitem(last=False)
+        self._apply_month_status(year, month, result)
+
+    def _apply_month_status(self, year, month, result):
+        status_data, holiday_names = result
+        self._status_month = (year, month)
+        self.calendar.set_holiday_names(holiday_names)
+        self.calendar.set_status_data(status_data)
 
+    def _compute_month_status(self, year, month, all_entries: List[TimeEntry]):
+        """Return the month's day states and holiday names, keyed by QDate"""
         status_data = {}
         holiday_names = {}
 
         # First, mark all official German holidays for the month
-        current_date = start_date.date()
-        while current_date <= end_date.date():
-            if self.calendar_service.is_holiday(current_date):
-                qdate = QDate(current_date.year, current_date.month, current_date.day)
-                status_data[qdate] = StatusCalendarWidget.STATE_HOLIDAY
-                holiday_name = self.calendar_service.get_holiday_name(current_date)
-                if holiday_name:
-                    holiday_names[qdate] = holiday_name
-            current_date += timedelta(days=1)
-
-        # Fetch all entries for the month
-        all_entries = []
-        for task in self.tasks:
-            entries = await self.entry_repo.get_overlapping(task.id, start_date, end_date)
-            all_entries.extend(entries)
+        for day, holiday_name in self.calendar_service.get_holidays_in_month(year, month).items():
+            qdate = QDate(day.year, day.month, day.day)
+            status_data[qdate] = StatusCalendarWidget.STATE_HOLIDAY
+            if holiday_name:
+                holiday_names[qdate] = holiday_name
+
+        day_state_by_task_id = self._day_state_by_task_id
+        priority = _STATE_PRIORITY
 
         # Process entries and determine day status
         # Priority: Sickness > Vacation > Holiday > Work
         for entry in all_entries:
+            # Work entries never override a state, so only Vacation/Sickness
+            # entries can change the map
+            new_state = day_state_by_task_id.get(entry.task_id)
+            if new_state is None:
+                continue
             qdate = QDate(entry.start_time.year, entry.start_time.month, entry.start_time.day)
+            if priority[new_state] > priority[status_data.get(qdate, StatusCalendarWidget.STATE_WORK)]:
+                status_data[qdate] = new_state
 
-            # Get task name
-            task_name = next((t.name for t in self.tasks if t.id == entry.task_id), "").lower()
-
-            # Determine state based on task name
-            new_state = StatusCalendarWidget.STATE_WORK
-            if task_name == "vacation":
-                new_state = StatusCalendarWidget.STATE_VACATION
-            elif task_name == "sickness":
-                new_state = StatusCalendarWidget.STATE_SICKNESS
-
-            # Priority: Sickness > Vacation > Holiday > Work
-            current = status_data.get(qdate, StatusCalendarWidget.STATE_WORK)
-            if current == StatusCalendarWidget.STATE_SICKNESS:
-                continue  # Keep Sickness (highest priority)
-            if current == StatusCalendarWidget.STATE_VACATION and new_state != StatusCalendarWidget.STATE_SICKNESS:
-                continue  # Keep Vacation unless new is Sickness
-            if current == StatusCalendarWidget.STATE_HOLIDAY and new_state == StatusCalendarWidget.STATE_WORK:
-                continue  # Keep Holiday unless user entry overrides
-
-            status_data[qdate] = new_state
-
-        self.calendar.set_holiday_names(holiday_names)
-        self.calendar.set_status_data(status_data)
+        return status_data, holiday_names
 
     def _cycle_day_status(self, qdate: QDate):
         """Cycle status: Work -> Vacation -> Sickness -> Work
@@ -1050,7 +1572,7 @@ class HistoryWindow(QWidget):
         date_end = datetime(qdate.year(), qdate.month(), qdate.day(), 23, 59, 59)
 
         # Apply the status cycle
-        self.loop.run_until_complete(
+        self._run_async(
             self._apply_status_cycle(date_start, date_end, current_status, next_status)
         )
 
@@ -1060,7 +1582,18 @@ class HistoryWindow(QWidget):
             return
 
         snapshot = self.undo_stack.pop()
-        self.loop.run_until_complete(self._restore_entries(snapshot))
+        self._run_async(self._restore_entries(snapshot))
+
+    def _push_undo(self, start: datetime, end: datetime, entries: List[TimeEntry]):
+        """Remember a day's entries as plain field tuples for undo"""
+        self.undo_stack.append({
+            "start": start,
+            "end": end,
+            "entries": [
+                (e.task_id, e.start_time, e.end_time, e.duration_seconds, e.notes)
+                for e in entries
+            ]
+        })
 
     async def _restore_entries(self, snapshot):
         """Restore entries from snapshot."""
@@ -1069,46 +1602,34 @@ class HistoryWindow(QWidget):
         entries = snapshot["entries"]
 
         try:
-            existing = []
-            if hasattr(self.entry_repo, "get_all_in_range"):
-                existing = await self.entry_repo.get_all_in_range(start, end)
-            else:
-                for task in self.tasks:
-                    existing.extend(await self.entry_repo.get_overlapping(task.id, start, end))
-            for entry in existing:
-                await self.entry_repo.delete(entry.id)
+            existing = await self._fetch_entries(start, end)
+            await self.entry_repo.delete_many([entry.id for entry in existing])
+            self._clear_entry_caches()
 
-            for entry in entries:
-                new_entry = TimeEntry(
-                    task_id=entry.task_id,
-                    start_time=entry.start_time,
-                    end_time=entry.end_time,
-                    duration_seconds=entry.duration_seconds,
-                    notes=entry.notes
+            await self.entry_repo.create_many(
+                TimeEntry(
+                    task_id=task_id,
+                    start_time=start_time,
+                    end_time=end_time,
+                    duration_seconds=duration_seconds,
+                    notes=notes
                 )
-                await self.entry_repo.create(new_entry)
+                for task_id, start_time, end_time, duration_seconds, notes in entries
+            )
 
-            await self._refresh_month_status(start.year, start.month)
-            await self._refresh_current_date_entries()
+            await self._refresh_month_and_day(start.year, start.month)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to undo change: {e}")
 
     async def _apply_status_cycle(self, start, end, current_status, next_status):
         """Apply the day status cycle with safety checks"""
         # Check existing entries for this day
-        all_entries = []
-        for task in self.tasks:
-            entries = await self.entry_repo.get_overlapping(task.id, start, end)
-            all_entries.extend(entries)
+        all_entries = await self._fetch_entries(start, end)
 
         has_entries = len(all_entries) > 0
 
         # Check if there are work entries (not vacation/sickness)
-        has_work_entries = any(
-            next((t.name for t in self.tasks if t.id == e.task_id), "").lower()
-            not in ["vacation", "sickness"]
-            for e in all_entries
-        )
+        has_work_entries = any(e.task_id not in self._day_state_by_task_id for e in all_entries)
 
         # Safety confirmation dialogs
         if next_status == StatusCalendarWidget.STATE_VACATION:
@@ -1133,25 +1654,23 @@ class HistoryWindow(QWidget):
                     return
 
         try:
-            self.undo_stack.append({
-                "start": start,
-                "end": end,
-                "entries": list(all_entries)
-            })
+            self._push_undo(start, end, all_entries)
 
             # Delete all existing entries for this day
-            for entry in all_entries:
-                await self.entry_repo.delete(entry.id)
+            await self.entry_repo.delete_many([entry.id for entry in all_entries])
+            self._invalidate_entry_cache(*all_entries)
+            self._entry_cache.pop(start.date(), None)
+            self._month_status_cache.pop((start.year, start.month), None)
 
             # Create new entry for Vacation or Sickness
             if next_status in [StatusCalendarWidget.STATE_VACATION, StatusCalendarWidget.STATE_SICKNESS]:
                 task_name = "Vacation" if next_status == StatusCalendarWidget.STATE_VACATION else "Sickness"
 
                 # Find or create the task
-                task = next((t for t in self.tasks if t.name.lower() == task_name.lower()), None)
+                task = self._task_by_lower_name.get(task_name.lower())
                 if not task:
                     task = await self.task_repo.create(Task(name=task_name))
-                    self.tasks.append(task)
+                    self._add_task(task)
 
                 # Get default work hours from settings
                 work_hours = self.settings.preferences.work_hours_per_day
@@ -1170,9 +1689,26 @@ class HistoryWindow(QWidget):
                 )
                 await self.entry_repo.create(new_entry)
 
-            # Refresh calendar and current view
-            await self._refresh_month_status(start.year, start.month)
-            await self._refresh_current_date_entries()
+            # Entries reaching into other days can change their status too,
+            # so those need the full month refresh
+            day_end = start + timedelta(days=1)
+            if any(e.start_time < start or (e.end_time or e.start_time) > day_end
+                   for e in all_entries):
+                await self._refresh_month_and_day(start.year, start.month)
+                return
+
+            # The status data may still belong to another month (e.g. a
+            # month change is pending), so patching one cell would mix months
+            if self._status_month != (start.year, start.month):
+                await self._refresh_month_and_day(
+                    self.calendar.yearShown(), self.calendar.monthShown()
+                )
+                return
+
+            # Otherwise only this day changed: patch its calendar cell
+            self.calendar.set_day_status(QDate(start.year, start.month, start.day), next_status)
+            if self.calendar.selectedDate().toPython() == start.date():
+                await self._refresh_current_date_entries()
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to update day status: {e}")
@@ -1180,11 +1716,18 @@ class HistoryWindow(QWidget):
     def _on_date_selected(self):
         """Handle date selection from calendar"""
         qdate = self.calendar.selectedDate()
-        self.date_label.setText(QLocale().toString(qdate, QLocale.LongFormat))
+        self._update_date_label(qdate)
 
-        # Fetch entries asynchronously
-        # Fetch entries asynchronously
-        self._run_async(self._refresh_current_date_entries())
+        # Fetch entries asynchronously; a newer selection supersedes this one
+        self._run_async(self._refresh_current_date_entries(), key="date")
+
+    def _update_date_label(self, qdate: QDate):
+        """Show the date in the current locale, skipping unchanged text"""
+        key = (qdate.toJulianDay(), QLocale().name())
+        if key == self._date_label_key:
+            return
+        self._date_label_key = key
+        self.date_label.setText(_format_long_date(*key))
 
     async def _refresh_current_date_entries(self):
         """Async method to refresh entries for the currently selected date"""
@@ -1192,110 +1735,123 @@ class HistoryWindow(QWidget):
 
         # Convert QDate to Python date
         py_date = qdate.toPython()
-        start_of_day = datetime.combine(py_date, datetime.min.time())
-        end_of_day = datetime.combine(py_date, datetime.max.time())
+        # Half-open [midnight, next midnight) range
+        start_of_day = datetime.combine(py_date, time.min)
+        end_of_day = start_of_day + timedelta(days=1)
 
-        # Fetch entries
+        # Fetch entries, reusing a cached day when possible
         try:
-            entries = await self._fetch_entries(start_of_day, end_of_day)
-            self.current_entries = entries
-            self._populate_tables(entries)
+            entries = self._entry_cache.get(py_date)
+            if entries is None:
+                entries = await self._fetch_entries(start_of_day, end_of_day)
+                summary = None
+                if (len(entries) >= self.THREADED_SUMMARY_MIN_ENTRIES
+                        and self.loop.is_running()):
+                    # Very large (e.g. imported) days: aggregate in a worker
+                    # thread and only touch Qt once it is done. This only
+                    # frees the UI thread under a running loop; under
+                    # run_until_complete the caller blocks either way, so
+                    # the day is summarized inline instead.
+                    summary = await asyncio.to_thread(_summarize_day, entries, datetime.now())
+                self._show_day_entries(py_date, entries, summary)
+            else:
+                self._entry_cache.move_to_end(py_date)
+                self.current_entries = entries
+                self._populate_tables(entries)
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to load entries: {e}")
 
-    async def _fetch_entries(self, start, end):
-        all_entries = []
-        for task in self.tasks:
-            entries = await self.entry_repo.get_overlapping(task.id, start, end)
-            all_entries.extend(entries)
-
-        # Sort by start time
-        all_entries.sort(key=lambda x: x.start_time)
-        return all_entries
-
-    def _populate_tables(self, entries: List[TimeEntry]):
-        # 1. Populate Detailed Table
-        self.table.setRowCount(len(entries))
-        day_total_seconds = 0
-        task_totals = {}
-
-        for row, entry in enumerate(entries):
-            # Task Name
-            task_name = next((t.name for t in self.tasks if t.id == entry.task_id), "Unknown")
-            self.table.setItem(row, 0, QTableWidgetItem(task_name))
-
-            # Start
-            self.table.setItem(row, 1, QTableWidgetItem(entry.start_time.strftime("%H:%M")))
-
-            # End
-            end_str = entry.end_time.strftime("%H:%M") if entry.end_time else "Active"
-            self.table.setItem(row, 2, QTableWidgetItem(end_str))
-
-            # Duration
-            # If active, duration might be dynamic, but here we show whatever is in DB or calculated up to now
-            # For active tasks, duration in DB might be 0 until stopped.
-            # Ideally we should calculate it live or show "Running"
-            if entry.end_time is None:
-                # Calculate duration up to now
-                duration = int((datetime.now() - entry.start_time).total_seconds())
-            else:
-                duration = entry.duration_seconds
-
-            day_total_seconds += duration
-
-            # Accumulate for summary
-            task_totals[task_name] = task_totals.get(task_name, 0) + duration
-
-            hours, remainder = divmod(duration, 3600)
-            minutes, seconds = divmod(remainder, 60)
+    def _show_day_entries(self, py_date, entries: List[TimeEntry],
+                          summary: Optional[_DaySummary] = None):
+        """Cache freshly loaded entries of a day and show them"""
+        if _is_cacheable_day(py_date, entries, datetime.now().date()):
+            self._entry_cache[py_date] = entries
+            if len(self._entry_cache) > self.ENTRY_CACHE_SIZE:
+                self._entry_cache.popitem(last=False)
+        self.current_entries = entries
+        self._populate_tables(entries, summary)
+
+    def _invalidate_entry_cache(self, *entries: TimeEntry):
+        """Drop cached days and month statuses touched by the given entries"""
+        for entry in entries:
+            day = entry.start_time.date()
+            last_day = (entry.end_time or entry.start_time).date()
+            while day <= last_day:
+                self._entry_cache.pop(day, None)
+                self._month_status_cache.pop((day.year, day.month), None)
+                day += timedelta(days=1)
+
+    def _clear_entry_caches(self):
+        """Drop all cached days and month statuses"""
+        self._entry_cache.clear()
+        self._month_status_cache.clear()
+
+    def invalidate_caches(self):
+        """Public method to drop cached data after entries were written elsewhere"""
+        self._clear_entry_caches()
 
-            # Use rounding to nearest minute for display to reduce visual discrepancies
-            # e.g. 1m 59s should show as 2m, not 1m
-            total_minutes = round(duration / 60)
-            hours, minutes = divmod(total_minutes, 60)
-
-            dur_str = f"{hours:02d}:{minutes:02d}"
-            self.table.setItem(row, 3, QTableWidgetItem(dur_str))
-
-            # Notes
-            self.table.setItem(row, 4, QTableWidgetItem(entry.notes or ""))
-
-        # 2. Populate Summary Table
-        sorted_totals = sorted(task_totals.items(), key=lambda x: x[1], reverse=True)
-        self.summary_table.setRowCount(len(sorted_totals))
-
-        for row, (name, duration) in enumerate(sorted_totals):
-            self.summary_table.setItem(row, 0, QTableWidgetItem(name))
-
-            # Round sum for summary as well
-            total_minutes = round(duration / 60)
-            hours, minutes = divmod(total_minutes, 60)
-            dur_str = f"{hours:02d}:{minutes:02d}"
-
-            self.summary_table.setItem(row, 1, QTableWidgetItem(dur_str))
-
-        # 3. Add Total as last row in summary table
-        self.summary_table.setRowCount(len(sorted_totals) + 1)  # +1 for total row
+    async def _fetch_entries(self, start, end):
+        """Entries of active tasks overlapping [start, end), sorted by start time"""
+        # One query for all active tasks rather than one per task
+        return await self.entry_repo.get_overlapping_range(
+            start, end, task_ids=[task.id for task in self.tasks]
+        )
 
-        total_row = len(sorted_totals)
-        total_name_item = QTableWidgetItem("Total")
-        total_name_item.setForeground(QColor("#1976d2"))
-        font = total_name_item.font()
-        font.setBold(True)
-        total_name_item.setFont(font)
-        self.summary_table.setItem(total_row, 0, total_name_item)
+    def _populate_tables(self, entries: List[TimeEntry], summary: Optional[_DaySummary] = None):
+        # Repaint each view once, after the models and compliance rows settle
+        self.table.setUpdatesEnabled(False)
+        self.summary_table.setUpdatesEnabled(False)
+        try:
+            self._fill_tables(entries, summary)
+        finally:
+            self.summary_table.setUpdatesEnabled(True)
+            self.table.setUpdatesEnabled(True)
+
+    def _fill_tables(self, entries: List[TimeEntry], summary: Optional[_DaySummary] = None):
+        if not entries:
+            # Empty day: nothing to aggregate, only clear what is shown
+            if self.entries_model.rowCount():
+                self.entries_model.set_entries([], [])
+            self._set_summary([], 0)
+            self._finished_seconds = 0
+            self._active_starts = []
+            self._check_violations()
+            return
 
-        total_minutes = round(day_total_seconds / 60)
-        hours, minutes = divmod(total_minutes, 60)
-        total_dur_str = f"{hours:02d}:{minutes:02d}"
+        if summary is None:
+            summary = _summarize_day(entries, datetime.now())
 
-        total_dur_item = QTableWidgetItem(total_dur_str)
-        total_dur_item.setForeground(QColor("#1976d2"))
-        total_dur_item.setFont(font)
-        self.summary_table.setItem(total_row, 1, total_dur_item)
+        self._populate_detailed(entries, summary.durations)
+        # Totals are by task ID; names are resolved once in the summary step
+        self._populate_summary(summary.task_totals, summary.name_by_id, summary.total_seconds)
 
+        self._active_starts = summary.active_starts
+        self._finished_seconds = summary.finished_seconds
         self._check_violations()
 
+    def _populate_detailed(self, entries: List[TimeEntry], durations: List[int]):
+        """Show the entries in the detailed table unless it already does"""
+        # Re-selecting a cached day hands back the same list; only running
+        # entries (whose durations grow) need a reset then
+        if not self.entries_model.is_showing(entries, durations):
+            self.entries_model.set_entries(entries, durations)
+
+    def _populate_summary(self, task_totals: Dict[int, int], name_by_id: Dict[int, str],
+                          day_total_seconds: int):
+        """Show per-task totals by name, with the Total row last"""
+        named_totals = defaultdict(int)
+        for task_id, seconds in task_totals.items():
+            named_totals[name_by_id.get(task_id, "Unknown")] += seconds
+        sorted_totals = sorted(named_totals.items(), key=itemgetter(1), reverse=True)
+        self._set_summary(sorted_totals, day_total_seconds)
+
+    def _set_summary(self, sorted_totals: List[Tuple[str, int]], day_total_seconds: int):
+        # Edits often leave the per-task totals untouched; skip the reset then
+        summary_sig = (tuple(sorted_totals), day_total_seconds)
+        if summary_sig != self._last_summary_sig:
+            self._last_summary_sig = summary_sig
+            self.summary_model.set_totals(sorted_totals, day_total_seconds)
+
     def _open_manual_entry(self):
         """Open the dialog to add a manual entry
 
@@ -1319,18 +1875,41 @@ class HistoryWindow(QWidget):
             QMessageBox.warning(self, "Cannot Add Entry", msg)
             return
 
-        dialog = ManualEntryDialog(self.tasks, self)
+        dialog = self._get_manual_dialog()
 
         # Set date to currently selected date
         dialog.date_edit.setDate(self.calendar.selectedDate())
 
         if dialog.exec():
             data = dialog.get_data()
-            try:
-                self.loop.run_until_complete(self._create_manual_entry(data))
-                self._on_date_selected() # Refresh
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to save entry: {e}")
+            self._run_async(
+                self._create_manual_entry(data),
+                on_done=lambda _: self._refresh_after_write(),
+                on_error=lambda e: QMessageBox.critical(self, "Error", f"Failed to save entry: {e}")
+            )
+
+    async def _resolve_task_id(self, task_name: str) -> int:
+        """Return the ID of the task with this name, creating it if needed"""
+        task_name = task_name.strip()
+        # Check if it actually exists by name to avoid duplicates
+        existing = self._task_by_lower_name.get(task_name.lower())
+        if existing:
+            return existing.id
+
+        created_task = await self.task_repo.create(Task(name=task_name))
+        self._add_task(created_task)
+        return created_task.id
+
+    async def _has_overlap(self, start: datetime, end: datetime,
+                           ignore_id: Optional[int] = None) -> bool:
+        """Check for overlapping entries, trying the shown day's entries first"""
+        # Same rule as TimeEntryRepository.has_overlap; a hit among the loaded
+        # entries is conclusive, a miss still needs the database
+        for existing in self.current_entries:
+            if (existing.id != ignore_id and existing.start_time < end
+                    and (existing.end_time is None or existing.end_time > start)):
+                return True
+        return await self.entry_repo.has_overlap(start, end, ignore_id=ignore_id)
 
     async def _create_manual_entry(self, data):
         task_id = data['task_id']
@@ -1345,26 +1924,17 @@ class HistoryWindow(QWidget):
             day_type = "a holiday" if is_holiday else "Sunday"
             raise ValueError(f"Work entries are not allowed on {day_type}.")
 
-        # If new task name (task_id is None), create task first
-        if task_id is None:
-            # Check if it actually exists by name to avoid duplicates
-            existing = next((t for t in self.tasks if t.name.lower() == data['task_name'].lower()), None)
-            if existing:
-                task_id = existing.id
-            else:
-                new_task = Task(name=data['task_name'])
-                created_task = await self.task_repo.create(new_task)
-                self.tasks.append(created_task)
-                task_id = created_task.id
-
-        # Calculate duration
         start = data['start_time']
         end = data['end_time']
 
-        # Check Overlap
-        if await self.entry_repo.has_overlap(start, end):
+        # Check Overlap before creating any new task for a rejected entry
+        if await self._has_overlap(start, end):
             raise ValueError("Time entry overlaps with an existing entry.")
 
+        # If new task name (task_id is None), create task first
+        if task_id is None:
+            task_id = await self._resolve_task_id(data['task_name'])
+
         duration = int((end - start).total_seconds())
 
         if duration < 0:
@@ -1379,6 +1949,7 @@ class HistoryWindow(QWidget):
         )
 
         await self.entry_repo.create(entry)
+        self._invalidate_entry_cache(entry)
 
     async def _update_entry(self, entry: TimeEntry, data: dict):
         """Update existing entry with new data"""
@@ -1393,29 +1964,24 @@ class HistoryWindow(QWidget):
             raise ValueError(f"Work entries are not allowed on {day_type}.")
 
         task_id = data['task_id']
-
-        # Handle new task creation if needed
-        if task_id is None:
-             existing = next((t for t in self.tasks if t.name.lower() == data['task_name'].lower()), None)
-             if existing:
-                 task_id = existing.id
-             else:
-                 new_task = Task(name=data['task_name'])
-                 created_task = await self.task_repo.create(new_task)
-                 self.tasks.append(created_task)
-                 task_id = created_task.id
-
         start = data['start_time']
         end = data['end_time']
 
         # Check Overlap (Ignore current entry ID)
-        if await self.entry_repo.has_overlap(start, end, ignore_id=entry.id):
+        if await self._has_overlap(start, end, ignore_id=entry.id):
             raise ValueError("Time entry overlaps with an existing entry.")
 
+        # Handle new task creation if needed
+        if task_id is None:
+            task_id = await self._resolve_task_id(data['task_name'])
+
         duration = int((end - start).total_seconds())
         if duration < 0:
             duration = 0
 
+        # The entry may move to other days; forget the ones it leaves too
+        self._invalidate_entry_cache(entry)
+
         # Update fields
         entry.task_id = task_id
         entry.start_time = start
@@ -1424,3 +1990,4 @@ class HistoryWindow(QWidget):
         entry.notes = data['notes']
 
         await self.entry_repo.update(entry)
+        self._invalidate_entry_cache(entry)
@@ -36,6 +36,7 @@ class MainWindow(QMainWindow):
     # Signals
     closed = Signal()  # Emitted when window is closed
     show_history = Signal() # Request to show history window
+    theme_changed = Signal(str)  # Request to apply a theme app-wide
 
     def __init__(self, timer_service: TimerService, tasks: List[Task], parent=None):
         super().__init__(parent)
@@ -707,16 +708,9 @@ class MainWindow(QMainWindow):
 
     def _on_theme_changed(self, theme: str):
         """Handle theme change from settings dialog"""
-        import qdarktheme
-        # Apply the theme globally
-        if theme == "auto":
-            qdarktheme.setup_theme("auto")
-        elif theme == "dark":
-            qdarktheme.setup_theme("dark")
-        else:
-            qdarktheme.setup_theme("light")
-        # Update this window's custom styling with the explicit theme
-        self.update_theme(theme)
+        # The tray applies the theme together with the application
+        # stylesheet and updates every open window, including this one
+        self.theme_changed.emit(theme)
 
     def mousePressEvent(self, event):
         """Allow dragging the window"""
@@ -225,6 +225,17 @@ class ReportWindow(QDialog):
 
         self._update_filename_if_default()
 
+    def prepare(self, year: int, month: int):
+        """Reset a reused window for a new run on the given month"""
+        self.status_label.setText("")
+        self.generate_btn.setEnabled(True)
+        self.template_combo.setCurrentIndex(0)
+        self.path_input.setText(tr("report.no_file"))
+        self.path_input.setStyleSheet("font-style: italic;")
+        # Tasks and saved settings may have changed since the last run
+        self.loop.run_until_complete(self._load_data())
+        self._set_period(year, month)
+
     def _update_filename_if_default(self):
         """Update filename if user hasn't typed a custom one"""
         current_text = self.path_input.text()
@@ -405,11 +405,6 @@ class SettingsDialog(QDialog):
             except Exception as e:
                 QMessageBox.critical(self, tr("error"), f"{tr('settings.delete_failed_msg')}\n{e}")
 
-    def _update_last_backup_label(self):
-        """Update the last backup date label"""
-        # This implementation is replaced by the one inside retranslate_ui to support translation
-        pass
-
     def _on_theme_preview(self, index: int):
         """Preview theme change immediately when selection changes"""
         if self._loading:
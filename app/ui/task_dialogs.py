@@ -1,5 +1,5 @@
 import asyncio
-from typing import List
+from typing import List, Optional
 from datetime import datetime
 
 from PySide6.QtWidgets import (
@@ -7,31 +7,40 @@ from PySide6.QtWidgets import (
     QPushButton, QHBoxLayout, QMessageBox, QHeaderView,
     QMenu, QComboBox, QCheckBox
 )
-from PySide6.QtGui import QAction
-from PySide6.QtCore import Qt
+from PySide6.QtGui import QAction, QStandardItemModel
+from PySide6.QtCore import Qt, QTimer
 
 from app.domain.models import Task, Accounting
 from app.infra.repository import TaskRepository, AccountingRepository
 from app.i18n import tr
+from app.ui.dialogs import build_combo_model
+from app.utils import get_event_loop
 
 class TaskManagementDialog(QDialog):
     """
     Manage Tasks (List, Inline Edit, Archive).
     """
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, repo: Optional[TaskRepository] = None,
+                 acc_repo: Optional[AccountingRepository] = None, loop=None):
         super().__init__(parent)
         self.setWindowTitle(tr("task_mgmt.title"))
         self.resize(800, 500)
-        
-        self.loop = asyncio.get_event_loop()
-        self.repo = TaskRepository()
-        self.acc_repo = AccountingRepository()
+
+        self.loop = loop or get_event_loop()
+        # Repositories are normally shared by the owning window
+        self.repo = repo or TaskRepository()
+        self.acc_repo = acc_repo or AccountingRepository()
         
         self.tasks: List[Task] = []
         self.accounting_profiles: List[Accounting] = []
+        self._acc_model: Optional[QStandardItemModel] = None
+        # Pending load under a running loop; a newer load supersedes it
+        self._load_task: Optional[asyncio.Task] = None
         
         self._setup_ui()
-        self._load_data()
+        self._show_loading()
+        # Load once the dialog is on screen so exec() is not held up by the DB
+        QTimer.singleShot(0, self._load_data)
         
     def _setup_ui(self):
         layout = QVBoxLayout(self)
@@ -77,22 +86,73 @@ class TaskManagementDialog(QDialog):
         layout.addLayout(btn_layout)
         
     def _load_data(self):
+        self._cancel_load()
+        self._show_loading()
+        coro = self._fetch_data(self.show_archived_cb.isChecked())
+        if self.loop.is_running():
+            # Under a running loop the dialog stays responsive while loading
+            self._load_task = self.loop.create_task(coro)
+            self._load_task.add_done_callback(self._on_data_loaded)
+            return
         try:
-            # Load Accounting Profiles
-            self.accounting_profiles = self.loop.run_until_complete(self.acc_repo.get_all_active())
-            
-            # Load Tasks
-            # Load Tasks
-            show_archived = self.show_archived_cb.isChecked()
-            self.tasks = self.loop.run_until_complete(self.repo.get_all(include_archived=show_archived))
-            
-            self._refresh_table()
+            self._apply_data(*self.loop.run_until_complete(coro))
         except Exception as e:
             QMessageBox.critical(self, tr("error"), tr("task_mgmt.load_error").format(error=e))
-            
+
+    async def _fetch_data(self, show_archived: bool):
+        """Load accounting profiles and tasks"""
+        accounting_profiles = await self.acc_repo.get_all_active()
+        tasks = await self.repo.get_all(include_archived=show_archived)
+        return accounting_profiles, tasks
+
+    def _cancel_load(self):
+        """Cancel a load still in flight"""
+        if self._load_task is not None and not self._load_task.done():
+            self._load_task.cancel()
+        self._load_task = None
+
+    def _on_data_loaded(self, task):
+        # Superseded or cancelled loads (e.g. the dialog closed) are ignored
+        if task is not self._load_task or task.cancelled():
+            return
+        self._load_task = None
+        if task.exception() is not None:
+            QMessageBox.critical(self, tr("error"),
+                                 tr("task_mgmt.load_error").format(error=task.exception()))
+            return
+        self._apply_data(*task.result())
+
+    def _apply_data(self, accounting_profiles: List[Accounting], tasks: List[Task]):
+        self.accounting_profiles = accounting_profiles
+        self.tasks = tasks
+        self._refresh_table()
+
+    def done(self, result):
+        """Stop a pending load before the dialog closes"""
+        self._cancel_load()
+        super().done(result)
+
+    def _show_loading(self):
+        """Show a placeholder row until the tasks are loaded"""
+        self.table.blockSignals(True)
+        self.table.setRowCount(0)
+        self.table.setRowCount(1)
+        item = QTableWidgetItem(tr("task_mgmt.loading"))
+        item.setFlags(Qt.NoItemFlags)
+        self.table.setItem(0, 0, item)
+        self.table.blockSignals(False)
+
     def _refresh_table(self):
         self.table.blockSignals(True)
         self.table.setRowCount(len(self.tasks))
+
+        # One accounting model shared by every row's combo box
+        acc_model = build_combo_model(
+            [(tr("task_edit.none"), None)]
+            + [(acc.name, acc.id) for acc in self.accounting_profiles],
+            self.table,
+        )
+        acc_index = {acc.id: i + 1 for i, acc in enumerate(self.accounting_profiles)}
         
         for row, task in enumerate(self.tasks):
             # Name (Editable Item)
@@ -102,13 +162,8 @@ class TaskManagementDialog(QDialog):
             
             # Accounting (ComboBox)
             acc_combo = QComboBox()
-            acc_combo.addItem(tr("task_edit.none"), None)
-            current_idx = 0
-            for i, acc in enumerate(self.accounting_profiles):
-                acc_combo.addItem(acc.name, acc.id)
-                if task.accounting_id == acc.id:
-                    current_idx = i + 1
-            acc_combo.setCurrentIndex(current_idx)
+            acc_combo.setModel(acc_model)
+            acc_combo.setCurrentIndex(acc_index.get(task.accounting_id, 0))
             
             # Connect signal using closure to capture row (careful with loop variable)
             acc_combo.currentIndexChanged.connect(lambda idx, r=row: self._on_accounting_changed(r))
@@ -123,7 +178,12 @@ class TaskManagementDialog(QDialog):
             
             status_combo.currentIndexChanged.connect(lambda idx, r=row: self._on_status_changed(r))
             self.table.setCellWidget(row, 2, status_combo)
-            
+
+        # Drop the model used by the combos that were just replaced
+        if self._acc_model is not None:
+            self._acc_model.deleteLater()
+        self._acc_model = acc_model
+
         self.table.blockSignals(False)
             
     def _on_item_changed(self, item: QTableWidgetItem):
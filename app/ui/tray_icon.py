@@ -14,7 +14,6 @@ from typing import Optional
 from PySide6.QtWidgets import QApplication, QSystemTrayIcon, QMenu, QMessageBox
 from PySide6.QtGui import QIcon, QPixmap, QColor, QAction, QKeySequence, QShortcut, QFont
 from PySide6.QtCore import QTimer, Qt
-import qdarktheme
 
 from app.services import CalendarService, TimerService, ReportService
 from app.services.backup_service import BackupService
@@ -29,7 +28,7 @@ from .main_window import MainWindow
 from .history_window import HistoryWindow
 from .settings_dialog import SettingsDialog
 from .splash_screen import SplashScreen
-from app.utils import get_resource_path
+from app.utils import apply_theme, get_resource_path, load_app_stylesheet
 
 
 class SystemTrayApp:
@@ -55,6 +54,9 @@ class SystemTrayApp:
         # Settings
         self.settings = get_settings()
 
+        # Application-wide stylesheet, read once and re-applied with every theme
+        self.app_qss = load_app_stylesheet()
+
         # Event loop for async operations (needed early for loading preferences)
         self.loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self.loop)
@@ -98,6 +100,7 @@ class SystemTrayApp:
         self.main_window = None
         self.history_window = None
         self.settings_window = None
+        self.interruption_dialog: Optional[InterruptionDialog] = None
 
         # Connect signals
         self._connect_signals()
@@ -138,15 +141,13 @@ class SystemTrayApp:
     def _apply_theme(self, theme: str):
         """Apply the specified theme using qdarktheme.
 
+        The application stylesheet is passed along as additional QSS because
+        qdarktheme replaces the application stylesheet on every call.
+
         Args:
             theme: 'light', 'dark', or 'auto' (follows system)
         """
-        if theme == "auto":
-            qdarktheme.setup_theme("auto")
-        elif theme == "dark":
-            qdarktheme.setup_theme("dark")
-        else:
-            qdarktheme.setup_theme("light")
+        apply_theme(theme, self.app_qss)
 
     def change_theme(self, theme: str):
         """Change the application theme at runtime.
@@ -251,6 +252,7 @@ class SystemTrayApp:
     def _on_task_started(self, task_id: int):
         """Handle task start event"""
         if self.history_window:
+            self.history_window.invalidate_caches()
             # Defer refresh to allow current async operation to complete
             # and ensure refresh_data runs with a fresh event loop context
             QTimer.singleShot(0, self.history_window.refresh_data)
@@ -258,6 +260,7 @@ class SystemTrayApp:
     def _on_task_stopped(self, task_id: int, total_seconds: int):
         """Handle task stop event"""
         if self.history_window:
+            self.history_window.invalidate_caches()
             QTimer.singleShot(0, self.history_window.refresh_data)
 
     def _on_task_created(self, task: Task):
@@ -292,6 +295,7 @@ class SystemTrayApp:
             self.main_window.closed.connect(self._on_main_window_closed)
             self.main_window.show_history.connect(self._show_history_window)
             self.main_window.task_created.connect(self._on_task_created)
+            self.main_window.theme_changed.connect(self.change_theme)
             self.main_window.show()
 
             # Close splash screen now that main window is ready
@@ -352,6 +356,8 @@ class SystemTrayApp:
                 recovered_count += 1
 
             if recovered_count > 0:
+                if self.history_window:
+                    self.history_window.invalidate_caches()
                 self.tray_icon.showMessage(
                     "Session Recovery",
                     f"Recovered {recovered_count} unfinished task(s) from previous session.",
@@ -446,6 +452,8 @@ class SystemTrayApp:
         """Show the history window"""
         if not self.history_window:
             self.history_window = HistoryWindow(self.loop)
+            # Quitting must not drop a regulation change still being debounced
+            self.app.aboutToQuit.connect(self.history_window.flush_pending_save)
         self.history_window.show()
         self.history_window.activateWindow()
 
@@ -522,7 +530,12 @@ class SystemTrayApp:
 
         # Ask user what to do with the time
         if self.user_prefs.ask_on_unlock and self.timer.active_task:
-            dialog = InterruptionDialog(elapsed_minutes)
+            # Reuse the dialog across interruptions; only the message changes
+            if self.interruption_dialog is None:
+                self.interruption_dialog = InterruptionDialog(elapsed_minutes)
+            else:
+                self.interruption_dialog.update_elapsed(elapsed_minutes)
+            dialog = self.interruption_dialog
             dialog.exec()
 
             was_work = dialog.choice == "track"
@@ -533,6 +546,8 @@ class SystemTrayApp:
                     self.loop.run_until_complete(
                         self.timer.mark_interruption(True, int(elapsed_seconds))
                     )
+                    if self.history_window:
+                        self.history_window.invalidate_caches()
                     self.tray_icon.showMessage(
                         "Time Added",
                         f"Added {elapsed_minutes:.1f} minutes to task",
@@ -583,6 +598,10 @@ class SystemTrayApp:
 
     def _quit_application(self):
         """Quit the application"""
+        # Write pending changes while the event loop is still open
+        if self.history_window:
+            self.history_window.flush_pending_save()
+
         # Stop tracking
         if self.timer.is_tracking():
             self.loop.run_until_complete(self.timer.stop_task())
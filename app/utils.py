@@ -1,5 +1,7 @@
+import asyncio
 import sys
 from pathlib import Path
+from typing import Optional
 
 def get_resource_path(relative_path: str) -> Path:
     """
@@ -20,3 +22,55 @@ def get_resource_path(relative_path: str) -> Path:
         base_path = Path(__file__).parent.parent.absolute()
 
     return base_path / relative_path
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the application's asyncio event loop without relying on the
+    deprecated implicit creation in ``asyncio.get_event_loop()``.
+
+    Returns:
+        The loop installed for the current thread, or a newly created and
+        installed loop if none exists yet.
+    """
+    try:
+        return asyncio.get_event_loop_policy().get_event_loop()
+    except RuntimeError:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        return loop
+
+
+def load_app_stylesheet() -> str:
+    """
+    Read the application-wide stylesheet from resources.
+
+    Returns:
+        The stylesheet text, or an empty string if it cannot be read.
+    """
+    qss_path = get_resource_path("app/resources/styles/app.qss")
+    try:
+        return qss_path.read_text(encoding="utf-8")
+    except OSError as e:
+        print(f"Failed to load stylesheet: {e}")
+        return ""
+
+
+def apply_theme(theme: str, app_qss: Optional[str] = None) -> None:
+    """
+    Apply a theme using qdarktheme together with the application stylesheet.
+
+    qdarktheme replaces the application stylesheet on every call, so the
+    application stylesheet must be passed along each time.
+
+    Args:
+        theme: 'light', 'dark', or 'auto' (follows system)
+        app_qss: Application stylesheet; read from resources if not given
+    """
+    import qdarktheme
+
+    if app_qss is None:
+        app_qss = load_app_stylesheet()
+    if theme not in ("auto", "dark"):
+        theme = "light"
+    qdarktheme.setup_theme(theme, additional_qss=app_qss)
@@ -330,3 +330,13 @@ class TestCalendarServiceConfiguration:
         regular_day = datetime.date(2026, 1, 2)
         name = service.get_holiday_name(regular_day)
         assert name == "", f"Regular day should have no holiday name, got: {name}"
+
+    def test_holidays_in_month_match_single_day_lookups(self):
+        """get_holidays_in_month should return exactly the month's holidays."""
+        service = CalendarService(german_state="BY")
+
+        december = service.get_holidays_in_month(2026, 12)
+
+        assert set(december) == {datetime.date(2026, 12, 25), datetime.date(2026, 12, 26)}
+        for day, name in december.items():
+            assert name == service.get_holiday_name(day)
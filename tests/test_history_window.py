@@ -0,0 +1,45 @@
+"""
+Tests for the history window's day caching rules.
+"""
+
+from datetime import date, datetime
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from app.domain.models import TimeEntry
+from app.ui.history_window import _is_cacheable_day
+
+
+def _entry(start, end=None):
+    return TimeEntry(
+        task_id=1,
+        start_time=start,
+        end_time=end,
+        duration_seconds=int(((end or start) - start).total_seconds()),
+    )
+
+
+def test_finished_past_day_is_cacheable():
+    """Past days whose entries are all finished are cached."""
+    entries = [_entry(datetime(2024, 1, 15, 9), datetime(2024, 1, 15, 17))]
+
+    assert _is_cacheable_day(date(2024, 1, 15), entries, today=date(2024, 1, 16))
+
+
+def test_past_day_with_running_entry_is_not_cacheable():
+    """A timer started before midnight keeps its day out of the cache."""
+    entries = [
+        _entry(datetime(2024, 1, 15, 9), datetime(2024, 1, 15, 12)),
+        _entry(datetime(2024, 1, 15, 23)),
+    ]
+
+    assert not _is_cacheable_day(date(2024, 1, 15), entries, today=date(2024, 1, 16))
+
+
+def test_today_is_not_cacheable():
+    """Today can still change through the timer."""
+    entries = [_entry(datetime(2024, 1, 16, 9), datetime(2024, 1, 16, 10))]
+
+    assert not _is_cacheable_day(date(2024, 1, 16), entries, today=date(2024, 1, 16))
@@ -0,0 +1,147 @@
+"""
+Tests for repository query helpers.
+"""
+
+from datetime import datetime
+
+import pytest
+from app.domain.models import Accounting, Task, TimeEntry
+from app.infra.repository import (
+    AccountingRepository, AccountingRow, TaskRepository, TimeEntryRepository
+)
+
+
+@pytest.mark.asyncio
+async def test_accounting_projection_returns_active_rows(db_session):
+    """Projection returns lightweight rows for active profiles only."""
+    repo = AccountingRepository(session=db_session)
+
+    active = await repo.create(Accounting(name="Project A", attributes={"Cost Center": "100"}))
+    retired = await repo.create(Accounting(name="Project B"))
+    await repo.delete(retired.id)
+
+    rows = await repo.get_all_active_projection()
+
+    assert rows == [AccountingRow(active.id, "Project A", {"Cost Center": "100"})]
+
+
+@pytest.mark.asyncio
+async def test_active_accounting_cache_invalidated_on_write(db_session):
+    """Cached active profiles are dropped when the repository writes."""
+    repo = AccountingRepository(session=db_session)
+
+    first = await repo.create(Accounting(name="Project A"))
+    assert [a.name for a in await repo.get_all_active()] == ["Project A"]
+
+    await repo.update(Accounting(id=first.id, name="Project Renamed"))
+    assert [a.name for a in await repo.get_all_active()] == ["Project Renamed"]
+
+    await repo.delete(first.id)
+    assert await repo.get_all_active() == []
+
+
+@pytest.mark.asyncio
+async def test_overlapping_range_spans_tasks_in_start_order(db_session):
+    """One range query returns overlapping entries of the given tasks, oldest first."""
+    task_repo = TaskRepository(session=db_session)
+    entry_repo = TimeEntryRepository(session=db_session)
+
+    coding = await task_repo.create(Task(name="Coding"))
+    review = await task_repo.create(Task(name="Review"))
+    other = await task_repo.create(Task(name="Other"))
+
+    def entry(task, start_hour, end_hour, day=15):
+        return TimeEntry(
+            task_id=task.id,
+            start_time=datetime(2024, 1, day, start_hour),
+            end_time=datetime(2024, 1, day, end_hour),
+            duration_seconds=(end_hour - start_hour) * 3600,
+        )
+
+    late = await entry_repo.create(entry(coding, 13, 14))
+    early = await entry_repo.create(entry(review, 9, 10))
+    await entry_repo.create(entry(other, 11, 12))
+    await entry_repo.create(entry(coding, 9, 10, day=16))
+
+    entries = await entry_repo.get_overlapping_range(
+        datetime(2024, 1, 15), datetime(2024, 1, 16), task_ids=[coding.id, review.id]
+    )
+
+    assert [e.id for e in entries] == [early.id, late.id]
+    assert [e.task_name for e in entries] == ["Review", "Coding"]
+
+
+@pytest.mark.asyncio
+async def test_overlapping_range_chunks_many_task_ids(db_session):
+    """Task IDs split over several IN clauses still give one ordered result."""
+    task_repo = TaskRepository(session=db_session)
+    entry_repo = TimeEntryRepository(session=db_session)
+    entry_repo.ID_CHUNK_SIZE = 2
+
+    tasks = [await task_repo.create(Task(name=f"Task {i}")) for i in range(5)]
+    created = []
+    for hour, task in zip((13, 9, 15, 11, 10), tasks):
+        created.append(await entry_repo.create(TimeEntry(
+            task_id=task.id,
+            start_time=datetime(2024, 1, 15, hour),
+            end_time=datetime(2024, 1, 15, hour, 30),
+            duration_seconds=1800,
+        )))
+
+    entries = await entry_repo.get_overlapping_range(
+        datetime(2024, 1, 15), datetime(2024, 1, 16), task_ids=[t.id for t in tasks]
+    )
+
+    assert [e.start_time.hour for e in entries] == [9, 10, 11, 13, 15]
+    assert {e.id for e in entries} == {e.id for e in created}
+
+@pytest.mark.asyncio
+async def test_create_many_and_delete_many_entries(db_session):
+    """Bulk create assigns IDs; bulk delete removes only the given entries."""
+    task_repo = TaskRepository(session=db_session)
+    entry_repo = TimeEntryRepository(session=db_session)
+    task = await task_repo.create(Task(name="Coding"))
+
+    created = await entry_repo.create_many(
+        TimeEntry(
+            task_id=task.id,
+            start_time=datetime(2024, 1, 15, hour),
+            end_time=datetime(2024, 1, 15, hour + 1),
+            duration_seconds=3600,
+        )
+        for hour in (9, 11, 13)
+    )
+    assert all(e.id is not None for e in created)
+
+    deleted = await entry_repo.delete_many([created[0].id, created[2].id])
+
+    remaining = await entry_repo.get_by_task(task.id)
+    assert deleted == 2
+    assert [e.id for e in remaining] == [created[1].id]
+
+
+@pytest.mark.asyncio
+async def test_active_accounting_cache_shared_across_instances(db_session):
+    """A write through one repository is seen by every other instance."""
+    reader = AccountingRepository(session=db_session)
+    writer = AccountingRepository(session=db_session)
+
+    assert await reader.get_all_active() == []
+    await writer.create(Accounting(name="Project A"))
+
+    assert [a.name for a in await reader.get_all_active()] == ["Project A"]
+
+
+@pytest.mark.asyncio
+async def test_active_accounting_cache_returns_copies(db_session):
+    """Mutating returned profiles does not change the cached ones."""
+    repo = AccountingRepository(session=db_session)
+    await repo.create(Accounting(name="Project A", attributes={"Cost Center": "100"}))
+
+    first = await repo.get_all_active()
+    first[0].name = "Changed"
+    first[0].attributes["Cost Center"] = "999"
+
+    [again] = await repo.get_all_active()
+    assert again.name == "Project A"
+    assert again.attributes == {"Cost Center": "100"}
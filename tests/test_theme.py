@@ -0,0 +1,67 @@
+"""
+Tests for applying themes together with the application stylesheet.
+"""
+
+import pytest
+
+from app.utils import apply_theme, load_app_stylesheet
+
+qdarktheme = pytest.importorskip("qdarktheme")
+
+
+@pytest.fixture
+def setup_calls(monkeypatch):
+    """Record qdarktheme.setup_theme calls instead of touching a QApplication"""
+    calls = []
+    monkeypatch.setattr(
+        qdarktheme, "setup_theme",
+        lambda theme, **kwargs: calls.append((theme, kwargs.get("additional_qss")))
+    )
+    return calls
+
+
+@pytest.mark.parametrize("theme", ["auto", "dark", "light"])
+def test_theme_change_keeps_app_stylesheet(setup_calls, theme):
+    """Every theme change re-applies the application stylesheet."""
+    apply_theme(theme)
+
+    [(applied_theme, qss)] = setup_calls
+    assert applied_theme == theme
+    assert qss == load_app_stylesheet()
+    assert "#interruptionMessage" in qss
+
+
+def test_unknown_theme_falls_back_to_light(setup_calls):
+    """Unknown theme names apply the light theme, as the settings do."""
+    apply_theme("sepia", app_qss="QLabel {}")
+
+    assert setup_calls == [("light", "QLabel {}")]
+
+
+@pytest.mark.parametrize("selector", [
+    "QPushButton#addEntryButton",
+    "QPushButton#manageTasksButton",
+    "QPushButton#generateReportButton",
+    "QLabel#historyLegendTitle",
+    "QLabel#historyDateLabel",
+    "QLabel#historySummaryHeader",
+    "QLabel#violationsLabel",
+    "QGroupBox#regulationsGroup",
+])
+def test_theme_change_keeps_history_window_styles(setup_calls, selector):
+    """History window styles moved into app.qss survive a theme change."""
+    apply_theme("dark")
+
+    [(_, qss)] = setup_calls
+    assert selector in qss
+
+
+def test_theme_change_keeps_status_calendar_styles(setup_calls):
+    """Status calendar cell rules in app.qss survive a theme change."""
+    apply_theme("light")
+
+    [(_, qss)] = setup_calls
+    for rule in ("QCalendarWidget#statusCalendar QAbstractItemView",
+                 "#statusCalendar QAbstractItemView::item:selected",
+                 "#statusCalendar QAbstractItemView::item:hover"):
+        assert rule in qss